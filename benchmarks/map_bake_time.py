@@ -0,0 +1,59 @@
+"""
+Measure how long it takes to build (parse + bake) every map in a save file.
+
+Run from the project root:
+    python -m benchmarks.map_bake_time [saves/game0.json]
+"""
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from src.utils import GameSettings
+
+ROUNDS = 5
+
+
+def main() -> None:
+    save_path = sys.argv[1] if len(sys.argv) > 1 else "saves/game0.json"
+    with open(save_path, "r") as f:
+        entries = json.load(f)["map"]
+
+    pg.init()
+    pg.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+    # Measure the actual baking, not the on-disk cache
+    GameSettings.MAP_CACHE = False
+
+    from src.maps import map as map_module
+    Map = map_module.Map
+
+    for label, clear_cache in (("cold tile cache", True), ("warm tile cache", False)):
+        print(f"--- {label} ---")
+        totals: dict[str, float] = {}
+        built = {}
+        for _ in range(ROUNDS):
+            for entry in entries:
+                if clear_cache:
+                    map_module._scaled_tiles.clear()
+                start = time.perf_counter()
+                built[entry["path"]] = Map.from_dict(entry)
+                totals[entry["path"]] = totals.get(entry["path"], 0.0) + time.perf_counter() - start
+
+        for entry in entries:
+            tmx = built[entry["path"]].tmxdata
+            layers = [layer for layer in tmx.visible_layers if hasattr(layer, "data")]
+            cells = sum(1 for layer in layers for _, _, gid in layer if gid)
+            unique = len({gid for layer in layers for _, _, gid in layer if gid})
+            print(
+                f"{entry['path']:>10}: {totals[entry['path']] / ROUNDS * 1000:7.2f} ms"
+                f"  ({cells} cells, {unique} unique tiles)"
+            )
+        print(f"shared tile cache: {len(map_module._scaled_tiles)} scaled tiles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Measure the per-frame cost of drawing a baked map.
+
+Run from the project root:
+    python -m benchmarks.map_frame_time [map.tmx]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from src.utils import GameSettings, Position, PositionCamera
+
+ROUNDS = 5
+
+
+def main() -> None:
+    map_name = sys.argv[1] if len(sys.argv) > 1 else "map.tmx"
+
+    pg.init()
+    screen = pg.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+    GameSettings.DRAW_HITBOXES = False
+
+    from src.maps.map import Map
+    game_map = Map(map_name, [], Position(0, 0))
+
+    # Sweep the camera over the whole map so every part of it gets blitted
+    map_w, map_h = game_map._surface.get_size()
+    cameras = [
+        PositionCamera(x, y)
+        for x in range(-screen.get_width() // 2, map_w, 97)
+        for y in range(-screen.get_height() // 2, map_h, 131)
+    ]
+
+    frames = 0
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for camera in cameras:
+            screen.fill((0, 0, 0))
+            game_map.draw(screen, camera)
+            game_map.draw_overlay(screen, camera)
+            frames += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"{map_name}: {frames} frames, {elapsed / frames * 1000:.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Measure path queries per second on a map and check that every path has the
+same length as the original A* (kept below as the reference). The original
+is timed twice: with the walkability check it used to have (a scan of every
+collision rect per tile, no map bounds) and with the map's walkability grid.
+
+Run from the project root:
+    python -m benchmarks.pathfinding [map.tmx] [queries]
+"""
+import heapq
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from src.utils import GameSettings, Logger
+
+SEED = 2025
+
+
+class _Node:
+    def __init__(self, x, y, parent=None):
+        self.x = x
+        self.y = y
+        self.parent = parent
+        self.g = 0
+        self.h = 0
+        self.f = 0
+
+    def __lt__(self, other):
+        return self.f < other.f
+
+
+def reference_find_path(start_pos, end_pos, game_map, is_walkable):
+    """The A* find_path used before the rewrite, unchanged apart from logging."""
+    if not is_walkable(game_map, end_pos[0], end_pos[1]):
+        return None
+    if start_pos == end_pos:
+        return []
+
+    start_node = _Node(start_pos[0], start_pos[1])
+    end_node = _Node(end_pos[0], end_pos[1])
+    open_list = []
+    closed_list = set()
+    heapq.heappush(open_list, start_node)
+
+    max_iterations = 3000
+    iterations = 0
+    while open_list:
+        iterations += 1
+        if iterations > max_iterations:
+            return None
+
+        current_node = heapq.heappop(open_list)
+        closed_list.add((current_node.x, current_node.y))
+
+        if current_node.x == end_node.x and current_node.y == end_node.y:
+            path = []
+            curr = current_node
+            while curr is not None:
+                path.append((curr.x, curr.y))
+                curr = curr.parent
+            return path[::-1]
+
+        for offset in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+            neighbor_pos = (current_node.x + offset[0], current_node.y + offset[1])
+            if neighbor_pos in closed_list:
+                continue
+            if not is_walkable(game_map, neighbor_pos[0], neighbor_pos[1]):
+                continue
+
+            neighbor = _Node(neighbor_pos[0], neighbor_pos[1], current_node)
+            neighbor.g = current_node.g + 1
+            neighbor.h = abs(neighbor.x - end_node.x) + abs(neighbor.y - end_node.y)
+            neighbor.f = neighbor.g + neighbor.h
+
+            existing_node = next((n for n in open_list if n.x == neighbor.x and n.y == neighbor.y), None)
+            if existing_node and existing_node.g < neighbor.g:
+                continue
+            heapq.heappush(open_list, neighbor)
+    return None
+
+
+def legacy_is_walkable(game_map, x, y):
+    """The rect-scanning is_walkable used before the walkability grid."""
+    if x < 0 or y < 0 or x >= 9999 or y >= 9999:   # Map had no size it could find
+        return False
+    ts = GameSettings.TILE_SIZE
+    margin = 4
+    return not game_map.check_collision(pg.Rect(x * ts + margin, y * ts + margin, ts - margin * 2, ts - margin * 2))
+
+
+def _rate(find, queries) -> tuple[float, list]:
+    start = time.perf_counter()
+    paths = [find(a, b) for a, b in queries]
+    return len(queries) / (time.perf_counter() - start), paths
+
+
+def main() -> None:
+    map_path = sys.argv[1] if len(sys.argv) > 1 else "map.tmx"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    with open("saves/game0.json", "r") as f:
+        entry = next(e for e in json.load(f)["map"] if e["path"] == map_path)
+
+    pg.init()
+    pg.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+    # Every unreachable target logs a warning, which would flood the output
+    Logger.setLevel(logging.ERROR)
+
+    from src.maps.map import Map
+    from src.utils import pathfinder
+    game_map = Map.from_dict(entry)
+    ts = GameSettings.TILE_SIZE
+    width, height = game_map.pixel_size[0] // ts, game_map.pixel_size[1] // ts
+    tiles = [(x, y) for y in range(height) for x in range(width) if pathfinder.is_walkable(game_map, x, y)]
+    rng = random.Random(SEED)
+    queries = [(rng.choice(tiles), rng.choice(tiles)) for _ in range(count)]
+    print(f"{map_path}: {width}x{height} tiles, {len(tiles)} walkable, {count} queries")
+
+    legacy_rate, _ = _rate(lambda a, b: reference_find_path(a, b, game_map, legacy_is_walkable), queries)
+    old_rate, old_paths = _rate(lambda a, b: reference_find_path(a, b, game_map, pathfinder.is_walkable), queries)
+    new_rate, new_paths = _rate(lambda a, b: pathfinder.find_path(a, b, game_map), queries)
+    print(f"reference, rect scan:  {legacy_rate:9.1f} queries/s")
+    print(f"reference, grid:       {old_rate:9.1f} queries/s")
+    print(f"current:               {new_rate:9.1f} queries/s  ({new_rate / legacy_rate:.1f}x)")
+
+    found = [(old, new) for old, new in zip(old_paths, new_paths) if old is not None]
+    mismatched = sum(new is None or len(new) != len(old) for old, new in found)
+    extra = sum(old is None and new is not None for old, new in zip(old_paths, new_paths))
+    print(f"paths found by the reference: {len(found)}, same length: {len(found) - mismatched}, different: {mismatched}")
+    print(f"found only by the current version (reference gave up): {extra}")
+    if mismatched:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
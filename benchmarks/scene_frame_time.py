@@ -0,0 +1,113 @@
+"""
+Run scenes headless with scripted input and report update / draw timing percentiles.
+
+Run from the project root:
+    python -m benchmarks.scene_frame_time [--frames N] [--warmup N] [scene ...]
+
+Scenes default to game, battle and catch_pokemon.
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+
+from src.utils import GameSettings
+
+DT = 1 / 60
+
+# Centre of BattleScene's "Fight" button (four 120 x 50 buttons, 20 px apart, centred 30 px above the bottom)
+FIGHT_BUTTON = (GameSettings.SCREEN_WIDTH // 2 - 210, GameSettings.SCREEN_HEIGHT - 55)
+
+# Scripted input per scene: (first frame, last frame, keys held, mouse buttons held, mouse pos).
+# The script loops over its total length.
+SCRIPTS: dict[str, list[tuple[int, int, set[int], set[int], tuple[int, int]]]] = {
+    "game": [
+        (0, 90, {pg.K_RIGHT}, set(), (0, 0)),
+        (90, 180, {pg.K_DOWN}, set(), (0, 0)),
+        (180, 270, {pg.K_LEFT}, set(), (0, 0)),
+        (270, 360, {pg.K_UP}, set(), (0, 0)),
+    ],
+    # Point at "Fight" and click it every 2 s; it is disabled during the enemy's turn
+    "battle": [
+        (0, 100, set(), set(), (0, 0)),
+        (100, 110, set(), set(), FIGHT_BUTTON),
+        (110, 112, set(), {1}, FIGHT_BUTTON),
+        (112, 120, set(), set(), FIGHT_BUTTON),
+    ],
+    "catch_pokemon": [
+        (0, 120, set(), set(), (0, 0)),
+    ],
+}
+
+def scripted_input(scene: str, frame: int) -> tuple[set[int], set[int], tuple[int, int]]:
+    script = SCRIPTS.get(scene, [])
+    if not script:
+        return set(), set(), (0, 0)
+    frame %= max(end for _, end, *_ in script)
+    for start, end, keys, mouse, pos in script:
+        if start <= frame < end:
+            return keys, mouse, pos
+    return set(), set(), (0, 0)
+
+
+def percentile(ordered: list[float], p: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def run_scene(engine, name: str, frames: int, warmup: int) -> dict[str, list[float]]:
+    from src.core.services import scene_manager, input_manager
+
+    scene_manager.change_scene(name)
+    engine.update(0)    # Switches happen on the next update
+    timings: dict[str, list[float]] = {"update": [], "draw": [], "frame": []}
+    for frame in range(warmup + frames):
+        engine.handle_events()
+        # Widgets get the scripted mouse through their HitGrid, like real clicks
+        input_manager.set_state(*scripted_input(name, frame))
+
+        start = time.perf_counter()
+        engine.update(DT)
+        mid = time.perf_counter()
+        engine.render()
+        end = time.perf_counter()
+
+        if frame >= warmup:
+            timings["update"].append((mid - start) * 1000)
+            timings["draw"].append((end - mid) * 1000)
+            timings["frame"].append((end - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="*", default=["game", "battle", "catch_pokemon"])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=30)
+    args = parser.parse_args()
+
+    # Measure the full draw every frame
+    GameSettings.DIRTY_RECTS = False
+
+    from src.core.engine import Engine
+    engine = Engine()
+
+    # Scenes print as they play, so report once everything has run
+    results = {name: run_scene(engine, name, args.frames, args.warmup) for name in args.scenes}
+
+    print(f"{'scene':<14}{'phase':<8}{'mean':>8}{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}  (ms, {args.frames} frames)")
+    for name, timings in results.items():
+        for phase, samples in timings.items():
+            ordered = sorted(samples)
+            print(
+                f"{name:<14}{phase:<8}{sum(ordered) / len(ordered):8.3f}"
+                f"{percentile(ordered, 0.5):8.3f}{percentile(ordered, 0.9):8.3f}"
+                f"{percentile(ordered, 0.99):8.3f}{ordered[-1]:8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measure cold-start time: process start -> first rendered frame of the game scene,
+and with the loading screen: process start -> first frame / menu ready.
+Every run is a fresh interpreter so nothing is shared in memory between runs.
+
+Run from the project root:
+    python -m benchmarks.startup_time
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 9
+
+
+def first_frame(map_cache: bool) -> None:
+    start = time.perf_counter()
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from src.utils import GameSettings
+    GameSettings.MAP_CACHE = map_cache
+
+    from src.core.engine import Engine
+    from src.core.services import scene_manager
+    engine = Engine()
+    scene_manager.change_scene("game")
+    engine.handle_events()
+    engine.update(0)
+    engine.render()
+    print(f"{(time.perf_counter() - start) * 1000:.1f}")
+
+
+def loading_screen() -> None:
+    start = time.perf_counter()
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from src.core.engine import Engine
+    from src.core.services import scene_manager
+    from src.scenes.menu_scene import MenuScene
+    engine = Engine(loading_screen=True)
+    first = None
+    while not isinstance(scene_manager._current_scene, MenuScene):
+        engine.clock.tick(60)
+        engine.handle_events()
+        engine.update(1 / 60)
+        engine.render()
+        if first is None:
+            first = time.perf_counter() - start
+    print(f"{first * 1000:.1f} {(time.perf_counter() - start) * 1000:.1f}")
+
+
+def measure(mode: str, runs: int = RUNS) -> list[list[float]]:
+    args = [sys.executable, "-m", "benchmarks.startup_time", "--child", mode]
+    results = []
+    for _ in range(runs):
+        out = subprocess.run(args, capture_output=True, text=True, check=True).stdout
+        results.append([float(v) for v in out.strip().splitlines()[-1].split()])
+    return results
+
+
+def report(label: str, times: list[float]) -> None:
+    print(f"{label:>26}: median {statistics.median(times):7.1f} ms  (min {min(times):.1f}, max {max(times):.1f})")
+
+
+def main() -> None:
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        if sys.argv[2] == "loading":
+            loading_screen()
+        else:
+            first_frame(sys.argv[2] == "1")
+        return
+
+    # One throwaway run so the map cache on disk is populated
+    measure("1", runs=1)
+    for label, mode in (("game frame, map cache off", "0"), ("game frame, map cache on", "1")):
+        report(label, [t[0] for t in measure(mode)])
+    times = measure("loading")
+    report("loading screen first frame", [t[0] for t in times])
+    report("loading screen menu ready", [t[1] for t in times])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,13 @@
+import argparse
+
 from src.core.engine import Engine
+from src.utils import GameSettings
 
 if __name__ == "__main__":
-    engine = Engine()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", metavar="LOG", help="record every frame's input to LOG")
+    parser.add_argument("--replay", metavar="LOG", help="play back input recorded with --record")
+    args = parser.parse_args()
+
+    engine = Engine(record=args.record, replay=args.replay, loading_screen=GameSettings.LOADING_SCREEN)
     engine.run()
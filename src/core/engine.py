@@ -1,22 +1,42 @@
+import random
+import time
 import pygame as pg
 
-from src.utils import GameSettings, Logger
-from .services import scene_manager, input_manager
+from src.utils import GameSettings, Logger, profiler
+from .services import scene_manager, input_manager, asset_loader
+from .managers import InputRecorder, InputReplay
 
 from src.scenes.menu_scene import MenuScene
 from src.scenes.game_scene import GameScene
 from src.scenes.setting_scene import SettingScene   # ← 要加這一行
 from src.scenes.battle_scene import BattleScene
 from src.scenes.catch_pokemon_scene import CatchPokemonScene
+from src.scenes.loading_scene import LoadingScene
+from src.maps.map_prefetcher import shutdown_prefetcher
+
+# Longest frame the fixed-timestep loop will catch up on, in seconds
+MAX_FRAME_TIME = 0.25
 
 class Engine:
 
     screen: pg.Surface              # Screen Display of the Game
     clock: pg.time.Clock            # Clock for FPS control
     running: bool                   # Running state of the game
+    recorder: InputRecorder | None  # Writes every update's input to a log
+    replay: InputReplay | None      # Drives updates from a log instead of SDL events
+    start_time: float               # perf_counter() when the engine was created
+    first_frame_time: float | None  # Seconds from start_time to the first presented frame
 
-    def __init__(self):
+    def __init__(self, record: str | None = None, replay: str | None = None, loading_screen: bool = False):
         Logger.info("Initializing Engine")
+        self.start_time = time.perf_counter()
+        self.first_frame_time = None
+
+        # Replays have to see the same random numbers as the recording, from the very start
+        self.recorder = InputRecorder(record) if record else None
+        self.replay = InputReplay(replay) if replay else None
+        if self.replay or self.recorder:
+            random.seed((self.replay or self.recorder).seed)
 
         pg.init()
 
@@ -26,40 +46,129 @@ class Engine:
 
         pg.display.set_caption(GameSettings.TITLE)
 
-        scene_manager.register_scene("menu", MenuScene())
-        scene_manager.register_scene("game", GameScene())
-        scene_manager.register_scene("battle", BattleScene())
-        scene_manager.register_scene("catch_pokemon", CatchPokemonScene())
-
-
-        '''
-        [TODO HACKATHON 5]
-        Register the setting scene here
-        '''
-        scene_manager.register_scene("setting", SettingScene())  # ← 正確的位置
+        # Scenes are built the first time they are entered. Battle scenes reload
+        # everything in enter(), so they can be freed while the player explores.
+        scene_manager.register_scene("menu", MenuScene)
+        scene_manager.register_scene("game", GameScene)
+        scene_manager.register_scene("battle", BattleScene, GameSettings.SCENE_UNLOAD_AFTER)
+        scene_manager.register_scene("catch_pokemon", CatchPokemonScene, GameSettings.SCENE_UNLOAD_AFTER)
+        # [TODO HACKATHON 5] Register the setting scene here
+        scene_manager.register_scene("setting", SettingScene)  # ← 正確的位置
+
+        if loading_screen:
+            # Show a window right away while the menu's assets are decoded behind it
+            scene_manager.register_scene("loading", LoadingScene("menu"))
+            scene_manager.change_scene("loading")
+            return
 
         scene_manager.change_scene("menu")
 
     def run(self):
         Logger.info("Running the Game Loop ...")
 
+        try:
+            if self.replay is not None:
+                self._run_replay()
+            else:
+                self._run_loop()
+        finally:
+            shutdown_prefetcher()
+            if self.recorder is not None:
+                self.recorder.close()
+
+    def _run_loop(self):
+        step = 1.0 / GameSettings.UPDATE_RATE
+        accumulator = 0.0
         while self.running:
             dt = self.clock.tick(GameSettings.FPS) / 1000.0
+            # Pump SDL every frame, even one that runs no update, so quitting and
+            # input aren't delayed and the OS doesn't think the window hangs
+            self.handle_events()
+            if not GameSettings.FIXED_TIMESTEP:
+                self.update(dt)
+                self.render()
+                continue
+
+            # Logic always advances in steps of exactly `step` seconds, however long
+            # the frame took. Clamp so a long stall (loading, dragging the window)
+            # doesn't turn into hundreds of catch-up steps.
+            accumulator += min(dt, MAX_FRAME_TIME)
+            while accumulator >= step and self.running:
+                self.update(step)
+                accumulator -= step
+
+            # How far we are between the last step and the next one
+            scene_manager.interpolation = accumulator / step
+            self.render()
+
+    def _run_replay(self):
+        # One recorded update per rendered frame; FPS = 0 replays as fast as possible
+        while self.running:
+            self.clock.tick(GameSettings.FPS)
             self.handle_events()
+            dt = self.replay.next_frame(input_manager)
+            if dt is None:
+                Logger.info(f"Replay finished after {self.replay.frames} frames")
+                break
             self.update(dt)
             self.render()
 
     def handle_events(self):
-        input_manager.reset()
-        for event in pg.event.get():
-            if event.type == pg.QUIT:
-                self.running = False
-            input_manager.handle_events(event)
+        with profiler.section("events"):
+            # Presses not yet seen by an update stay latched (InputManager.consume)
+            input_manager.begin_step()
+            for event in pg.event.get():
+                if event.type == pg.QUIT:
+                    self.running = False
+                elif event.type == pg.WINDOWEXPOSED:
+                    # The window contents may be gone, partial updates aren't enough
+                    scene_manager.invalidate()
+                elif event.type == pg.KEYDOWN and event.key == pg.K_F3:
+                    profiler.toggle_overlay()
+                    scene_manager.invalidate()
+                elif event.type == pg.KEYDOWN and event.key == pg.K_F4 and profiler.enabled:
+                    Logger.info(f"Profile written to {profiler.dump()}.csv/.json")
+                input_manager.handle_events(event)
 
     def update(self, dt: float):
-        scene_manager.update(dt)
+        # A catch-up step in the same frame mustn't see the same clicks again
+        input_manager.begin_step()
+        if self.recorder is not None:
+            self.recorder.record(dt, input_manager)
+        with profiler.section("update"):
+            # Hand over whatever the background loader finished since the last update
+            asset_loader.poll()
+            scene_manager.update(dt)
+        input_manager.consume()
 
     def render(self):
-        self.screen.fill((0, 0, 0))     # Make sure the display is cleared
-        scene_manager.draw(self.screen) # Draw the current scene
-        pg.display.flip()               # Render the display
+        rects = scene_manager.dirty_rects() if GameSettings.DIRTY_RECTS else None
+        # The profiler overlay changes every frame
+        if profiler.overlay_visible:
+            rects = None
+        if rects is None:
+            with profiler.section("draw"):
+                self.screen.fill((0, 0, 0))     # Make sure the display is cleared
+                scene_manager.draw(self.screen) # Draw the current scene
+            profiler.draw(self.screen)
+            with profiler.section("flip"):
+                pg.display.flip()               # Render the display
+            profiler.end_frame()
+            if self.first_frame_time is None:
+                self.first_frame_time = time.perf_counter() - self.start_time
+                Logger.info(f"First frame after {self.first_frame_time * 1000:.0f} ms")
+            return
+
+        # Nothing changed: keep the previous frame on screen
+        if not rects:
+            profiler.end_frame()
+            return
+        # Only redraw (and present) the regions the scene reported
+        with profiler.section("draw"):
+            self.screen.set_clip(rects[0].unionall(rects[1:]))
+            self.screen.fill((0, 0, 0))
+            scene_manager.draw(self.screen)
+            self.screen.set_clip(None)
+        with profiler.section("flip"):
+            pg.display.update(rects)
+        profiler.end_frame()
@@ -1,6 +1,8 @@
 from .scene_manager import SceneManager
-from .input_manager import InputManager
+from .input_manager import InputManager, InputSnapshot, PointerTarget, HitGrid
+from .input_recorder import InputRecorder, InputReplay
 from .resource_manager import ResourceManager
+from .asset_loader import AssetLoader, AssetManifest
 from .sound_manager import SoundManager
 from .game_manager import GameManager
 from .online_manager import OnlineManager
\ No newline at end of file
@@ -0,0 +1,75 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import pygame as pg
+
+from src.utils import GameSettings, Logger
+from src.utils.loader import ASSETS_DIR
+from .resource_manager import ResourceManager
+
+
+@dataclass
+class AssetManifest:
+    """Files a scene needs, so they can be decoded before the scene is built."""
+    images: list[str] = field(default_factory=list)     # under assets/images
+    sounds: list[str] = field(default_factory=list)     # under assets/sounds
+    music: list[str] = field(default_factory=list)      # under assets/sounds, streamed unless STREAM_BGM is off
+
+
+def _decode_image(path: str) -> pg.Surface:
+    # Runs on a worker: decode only, convert_alpha() happens on the main thread
+    return pg.image.load(str(ASSETS_DIR / "images" / path))
+
+
+def _decode_sound(path: str) -> pg.mixer.Sound:
+    return pg.mixer.Sound(str(ASSETS_DIR / "sounds" / path))
+
+
+class AssetLoader:
+    """
+    Decodes images and sounds on a worker pool. Finished assets are handed to
+    the ResourceManager by poll(), which must be called from the main thread.
+    """
+    _resources: ResourceManager
+    _executor: ThreadPoolExecutor | None
+    _pending: dict[tuple[str, str], Future]
+
+    def __init__(self, resources: ResourceManager):
+        self._resources = resources
+        self._executor = None
+        self._pending = {}
+
+    @property
+    def idle(self) -> bool:
+        return not self._pending
+
+    def pending(self, manifest: AssetManifest) -> int:
+        """How many of the manifest's files are still being decoded."""
+        return (sum(("image", path) in self._pending for path in manifest.images)
+                + sum(("sound", path) in self._pending for path in manifest.sounds))
+
+    def load(self, manifest: AssetManifest) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(GameSettings.ASSET_WORKERS, thread_name_prefix="asset")
+        jobs = [("image", path, _decode_image) for path in manifest.images if not self._resources.has_image(path)]
+        jobs += [("sound", path, _decode_sound) for path in manifest.sounds if not self._resources.has_sound(path)]
+        for kind, path, decode in jobs:
+            if (kind, path) in self._pending:
+                continue
+            self._pending[(kind, path)] = self._executor.submit(decode, path)
+
+    def poll(self) -> None:
+        if not self._pending:
+            return
+        for key in [key for key, future in self._pending.items() if future.done()]:
+            kind, path = key
+            try:
+                asset = self._pending.pop(key).result()
+            except Exception as e:
+                # Left to the synchronous loader, which reports the error properly
+                Logger.warning(f"Failed to preload {kind} {path}: {e}")
+            else:
+                if kind == "image":
+                    self._resources.add_image(path, asset.convert_alpha())
+                else:
+                    self._resources.add_sound(path, asset)
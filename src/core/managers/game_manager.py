@@ -2,10 +2,12 @@ from __future__ import annotations
 from src.utils import Logger, GameSettings, Position, Teleport
 import json, os
 import pygame as pg
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from src.maps.map import Map
+    from src.maps.map import Map, MapInfo
+    from src.maps.map_prefetcher import MapPrefetcher
     from src.entities.player import Player
     from src.entities.enemy_trainer import EnemyTrainer
     from src.data.bag import Bag
@@ -18,20 +20,31 @@ class GameManager:
     
     # Map properties
     current_map_key: str
-    maps: dict[str, Map]
+    map_infos: dict[str, MapInfo]
+    maps: OrderedDict[str, Map]     # Loaded maps, least recently used first
+    prefetcher: MapPrefetcher
+    map_sizes: dict[str, int]       # Bytes each map took the last time it was loaded
+    nearby_maps: set[str]           # Destinations of the teleporters the player is close to
+    evicted_nearby: set[str]        # Nearby maps evicted since the player came close; not prefetched again
     
     # Changing Scene properties
     should_change_scene: bool
     next_map: str
     
-    def __init__(self, maps: dict[str, Map], start_map: str, 
+    def __init__(self, map_infos: dict[str, MapInfo], start_map: str, 
                  player: Player | None,
                  enemy_trainers: dict[str, list[EnemyTrainer]], 
                  bag: Bag | None = None):
                      
         from src.data.bag import Bag
+        from src.maps.map_prefetcher import MapPrefetcher
         # Game Properties
-        self.maps = maps
+        self.map_infos = map_infos
+        self.maps = OrderedDict()
+        self.prefetcher = MapPrefetcher()
+        self.map_sizes = {}
+        self.nearby_maps = set()
+        self.evicted_nearby = set()
         self.current_map_key = start_map
         self.player = player
         self.enemy_trainers = enemy_trainers
@@ -43,7 +56,7 @@ class GameManager:
         
     @property
     def current_map(self) -> Map:
-        return self.maps[self.current_map_key]
+        return self.get_map(self.current_map_key)
         
     @property
     def current_enemy_trainers(self) -> list[EnemyTrainer]:
@@ -51,11 +64,87 @@ class GameManager:
         
     @property
     def current_teleporter(self) -> list[Teleport]:
-        return self.maps[self.current_map_key].teleporters
+        return self.map_infos[self.current_map_key].teleporters
+
+    def get_map(self, key: str) -> Map:
+        """
+        Maps are only built the first time they are needed.
+        Loading one may evict the least recently used maps to stay within MAP_MEMORY_BUDGET.
+        """
+        game_map = self.maps.get(key)
+        if game_map is not None:
+            self.maps.move_to_end(key)
+            return game_map
+
+        # Already being built in the background: finish that instead of starting over
+        game_map = self.prefetcher.wait(key)
+        if game_map is None:
+            from src.maps.map import Map
+            Logger.info(f"Loading map '{key}'")
+            game_map = Map.from_info(self.map_infos[key])
+        self._add_map(key, game_map)
+        return game_map
+
+    def prefetch_maps(self) -> None:
+        """
+        Called once per frame. Starts building the destination of every teleporter
+        the player is close to, and adopts the maps that finished in the background.
+
+        A destination is only requested if it fits in MAP_MEMORY_BUDGET next to the
+        maps that must stay (current, next and the other nearby ones), and a nearby
+        map that was evicted anyway is not requested again until the player has
+        left its teleporter, so two nearby maps can't keep evicting each other.
+        """
+        for key, game_map in self.prefetcher.collect():
+            self._add_map(key, game_map)
+
+        if self.player is None:
+            return
+        radius = GameSettings.MAP_PREFETCH_DISTANCE * GameSettings.TILE_SIZE
+        px, py = self.player.position.x, self.player.position.y
+        distances: dict[str, float] = {}
+        for tp in self.current_teleporter:
+            d = (tp.pos.x - px) ** 2 + (tp.pos.y - py) ** 2
+            if tp.destination in self.map_infos and d <= radius * radius:
+                distances[tp.destination] = min(d, distances.get(tp.destination, d))
+        self.nearby_maps = set(distances)
+        self.evicted_nearby &= self.nearby_maps
+
+        wanted = [key for key in distances if key not in self.maps and not self.prefetcher.is_pending(key)]
+        if not wanted:
+            return
+        kept = {self.current_map_key, self.next_map} | self.nearby_maps
+        used = sum(self.map_sizes.get(key, 0) for key in kept if key in self.maps or self.prefetcher.is_pending(key))
+        # Closest teleporter first; sizes are only known for maps loaded before
+        for key in sorted(wanted, key=distances.__getitem__):
+            size = self.map_sizes.get(key, 0)
+            if key in self.evicted_nearby or used + size > GameSettings.MAP_MEMORY_BUDGET:
+                continue
+            used += size
+            self.prefetcher.request(key, self.map_infos[key])
+
+    def _add_map(self, key: str, game_map: Map) -> None:
+        self.maps[key] = game_map
+        self.maps.move_to_end(key)
+        self.map_sizes[key] = game_map.memory_usage()
+        self._evict_maps(keep=key)
+
+    def _evict_maps(self, keep: str) -> None:
+        protected = {keep, self.current_map_key, self.next_map}
+        used = sum(m.memory_usage() for m in self.maps.values())
+        for key in list(self.maps):
+            if used <= GameSettings.MAP_MEMORY_BUDGET:
+                break
+            if key in protected:
+                continue
+            used -= self.maps.pop(key).memory_usage()
+            if key in self.nearby_maps:
+                self.evicted_nearby.add(key)
+            Logger.info(f"Evicted map '{key}' ({used / 2**20:.1f} MiB of maps still loaded)")
     
     def switch_map(self, target: str) -> None:
-        if target not in self.maps:
-            Logger.warning(f"Map '{target}' not loaded; cannot switch.")
+        if target not in self.map_infos:
+            Logger.warning(f"Map '{target}' not found; cannot switch.")
             return
         
         self.next_map = target
@@ -66,11 +155,14 @@ class GameManager:
             self.current_map_key = self.next_map
             self.next_map = ""
             self.should_change_scene = False
+            # Different teleporters now
+            self.nearby_maps.clear()
+            self.evicted_nearby.clear()
             if self.player:
-                self.player.position = self.maps[self.current_map_key].spawn
+                self.player.position = self.map_infos[self.current_map_key].spawn
             
     def check_collision(self, rect: pg.Rect) -> bool:
-        if self.maps[self.current_map_key].check_collision(rect):
+        if self.current_map.check_collision(rect):
             return True
         for entity in self.enemy_trainers[self.current_map_key]:
             if rect.colliderect(entity.animation.rect):
@@ -98,8 +190,8 @@ class GameManager:
 
     def to_dict(self) -> dict[str, object]:
         map_blocks: list[dict[str, object]] = []
-        for key, m in self.maps.items():
-            block = m.to_dict()
+        for key, info in self.map_infos.items():
+            block = info.to_dict()
             block["enemy_trainers"] = [t.to_dict() for t in self.enemy_trainers.get(key, [])]
             spawn = self.player_spawns.get(key)
             block["player"] = {
@@ -116,20 +208,20 @@ class GameManager:
 
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> "GameManager":
-        from src.maps.map import Map
+        from src.maps.map import MapInfo
         from src.entities.player import Player
         from src.entities.enemy_trainer import EnemyTrainer
         from src.data.bag import Bag
         
-        Logger.info("Loading maps")
+        Logger.info("Loading map list")
         maps_data = data["map"]
-        maps: dict[str, Map] = {}
+        map_infos: dict[str, MapInfo] = {}
         player_spawns: dict[str, Position] = {}
         trainers: dict[str, list[EnemyTrainer]] = {}
 
         for entry in maps_data:
             path = entry["path"]
-            maps[path] = Map.from_dict(entry)
+            map_infos[path] = MapInfo.from_dict(entry)
             sp = entry.get("player")
             if sp:
                 player_spawns[path] = Position(
@@ -138,7 +230,7 @@ class GameManager:
                 )
         current_map = data["current_map"]
         gm = cls(
-            maps, current_map,
+            map_infos, current_map,
             None, # Player
             trainers,
             bag=None
@@ -1,5 +1,119 @@
 import pygame as pg
-from src.utils import Logger, MouseBtn, Key
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+from src.utils import GameSettings, Logger, MouseBtn, Key
+
+
+@dataclass
+class InputSnapshot:
+    """Everything InputManager knows about one frame."""
+    down_keys: set[Key]
+    pressed_keys: set[Key]
+    released_keys: set[Key]
+    down_mouse: set[MouseBtn]
+    pressed_mouse: set[MouseBtn]
+    released_mouse: set[MouseBtn]
+    mouse_pos: tuple[int, int]
+    mouse_wheel: int
+
+
+class PointerTarget:
+    """
+    A widget that gets the left mouse button and the wheel from
+    InputManager.dispatch instead of polling the mouse every frame.
+    Override the events you need.
+    """
+    enabled: bool = True    # Disabled targets are skipped by hit-testing
+
+    def on_hover(self, hovered: bool) -> None:
+        """The pointer entered (True) or left (False) the target."""
+
+    def on_press(self, pos: tuple[int, int]) -> None:
+        """Pressed over the target. It keeps receiving on_drag until released."""
+
+    def on_drag(self, pos: tuple[int, int]) -> None:
+        """The pointer moved while the press that started on this target is held."""
+
+    def on_release(self, pos: tuple[int, int]) -> None:
+        """Released, sent to the pressed target and to the one under the pointer."""
+
+    def on_wheel(self, steps: int, pos: tuple[int, int]) -> None:
+        """The wheel turned `steps` notches (+ away from the user) over the target."""
+
+
+class HitGrid:
+    """
+    The interactive widgets of one screen / overlay, indexed in a grid of
+    HIT_GRID_CELL pixel cells so finding the widget under the pointer only
+    looks at the few rects in its cell. Widgets added later are on top.
+    Also keeps the hover / press state that InputManager.dispatch works from.
+    """
+    _cells: defaultdict[tuple[int, int], list[tuple[pg.Rect, PointerTarget]]]
+    hovered: PointerTarget | None
+    captured: PointerTarget | None      # Target of the press being held
+    last_pos: tuple[int, int] | None    # Pointer position at the last dispatch, None to hit-test again
+    pointer: tuple[int, int]            # Pointer position at the last dispatch
+
+    def __init__(self, targets: Iterable[tuple[PointerTarget, pg.Rect]] = ()):
+        self._cells = defaultdict(list)
+        self.hovered = None
+        self.captured = None
+        self.last_pos = None
+        self.pointer = (0, 0)
+        for target, rect in targets:
+            self.add(target, rect)
+
+    def add(self, target: PointerTarget, rect: pg.Rect) -> None:
+        rect = pg.Rect(rect)
+        cell = GameSettings.HIT_GRID_CELL
+        for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+            for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                self._cells[(cx, cy)].append((rect, target))
+        self.refresh()
+
+    def move(self, target: PointerTarget, rect: pg.Rect) -> None:
+        """Give a target already in the grid a new rect, e.g. after it was resized."""
+        for entries in self._cells.values():
+            entries[:] = [entry for entry in entries if entry[1] is not target]
+        self.add(target, rect)
+
+    def clear(self) -> None:
+        """Remove every target. The hovered / pressed one is told the pointer left and was released."""
+        if self.hovered is not None:
+            self._leave(self.hovered)
+        if self.captured is not None:
+            self._leave(self.captured)
+        self._cells.clear()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Hit-test again at the next dispatch, e.g. after a target was enabled / disabled."""
+        self.last_pos = None
+
+    def set_enabled(self, target: PointerTarget, enabled: bool) -> None:
+        """Disabling a hovered / pressed target sends it on_hover(False) / on_release first."""
+        if target.enabled != enabled:
+            if not enabled:
+                self._leave(target)
+            target.enabled = enabled
+            self.refresh()
+
+    def _leave(self, target: PointerTarget) -> None:
+        """End the hover and press `target` is part of, so it doesn't stay drawn hovered / pressed."""
+        if self.hovered is target:
+            self.hovered = None
+            target.on_hover(False)
+        if self.captured is target:
+            self.captured = None
+            target.on_release(self.pointer)
+
+    def hit(self, pos: tuple[int, int]) -> PointerTarget | None:
+        cell = GameSettings.HIT_GRID_CELL
+        for rect, target in reversed(self._cells.get((pos[0] // cell, pos[1] // cell), ())):
+            if target.enabled and rect.collidepoint(pos):
+                return target
+        return None
 
 
 class InputManager:
@@ -16,12 +130,29 @@ class InputManager:
         self.mouse_pos: tuple[int, int] = (0, 0)
         self.mouse_wheel: int = 0  # +1 / -1
 
+        # An update has seen the current presses / releases (see consume())
+        self._consumed: bool = False
+
     def reset(self) -> None:
         self._pressed_keys.clear()
         self._released_keys.clear()
         self._pressed_mouse.clear()
         self._released_mouse.clear()
         self.mouse_wheel = 0
+        self._consumed = False
+
+    def consume(self) -> None:
+        """
+        Called after each logic update. Presses, releases and wheel turns stay
+        latched until then, so a frame that runs no update doesn't lose them;
+        the next begin_step() clears them so a second update doesn't repeat them.
+        """
+        self._consumed = True
+
+    def begin_step(self) -> None:
+        """Drop the presses / releases an earlier update already handled."""
+        if self._consumed:
+            self.reset()
         
     def handle_events(self, e: pg.event.Event) -> None:
         if e.type == pg.MOUSEMOTION:
@@ -45,6 +176,74 @@ class InputManager:
             self._down_keys.discard(e.key)
             self._released_keys.add(e.key)
 
+    def set_state(self, keys: set[Key], mouse: set[MouseBtn], mouse_pos: tuple[int, int]) -> None:
+        """
+        Replace the held keys / buttons for this frame without SDL events
+        (scripted input, replays). Pressed and released are derived from the previous state.
+        """
+        self._pressed_keys |= keys - self._down_keys
+        self._released_keys |= self._down_keys - keys
+        self._down_keys = set(keys)
+        self._pressed_mouse |= mouse - self._down_mouse
+        self._released_mouse |= self._down_mouse - mouse
+        self._down_mouse = set(mouse)
+        self.mouse_pos = mouse_pos
+
+    def snapshot(self) -> InputSnapshot:
+        return InputSnapshot(
+            set(self._down_keys), set(self._pressed_keys), set(self._released_keys),
+            set(self._down_mouse), set(self._pressed_mouse), set(self._released_mouse),
+            self.mouse_pos, self.mouse_wheel
+        )
+
+    def load_snapshot(self, s: InputSnapshot) -> None:
+        """Replace the whole input state, e.g. with a frame from a replay."""
+        self._down_keys, self._pressed_keys, self._released_keys = set(s.down_keys), set(s.pressed_keys), set(s.released_keys)
+        self._down_mouse, self._pressed_mouse, self._released_mouse = set(s.down_mouse), set(s.pressed_mouse), set(s.released_mouse)
+        self.mouse_pos = s.mouse_pos
+        self.mouse_wheel = s.mouse_wheel
+
+    def dispatch(self, grid: HitGrid) -> None:
+        """
+        Send this frame's pointer events to the widgets of `grid`: hover changes
+        to the widgets entered and left, presses, drags and wheel turns to the
+        one under the pointer. Without mouse input this returns straight away, however
+        many widgets there are.
+        """
+        pos = self.mouse_pos
+        pressed = 1 in self._pressed_mouse
+        # Also ends a press that was released while the grid wasn't dispatched
+        released = 1 in self._released_mouse or (grid.captured is not None and 1 not in self._down_mouse)
+        if pos == grid.last_pos and not pressed and not released and not self.mouse_wheel:
+            return
+
+        grid.pointer = pos
+        if pos != grid.last_pos:
+            grid.last_pos = pos
+            if grid.captured is not None:
+                grid.captured.on_drag(pos)
+            target = grid.hit(pos)
+            if target is not grid.hovered:
+                if grid.hovered is not None:
+                    grid.hovered.on_hover(False)
+                grid.hovered = target
+                if target is not None:
+                    target.on_hover(True)
+
+        if pressed and grid.hovered is not None:
+            target = grid.captured = grid.hovered
+            target.on_press(pos)
+
+        if self.mouse_wheel and grid.hovered is not None:
+            grid.hovered.on_wheel(self.mouse_wheel, pos)
+
+        if released:
+            captured, grid.captured = grid.captured, None
+            if captured is not None:
+                captured.on_release(pos)
+            if grid.hovered is not None and grid.hovered is not captured:
+                grid.hovered.on_release(pos)
+
     def key_down(self, k: Key) -> bool:
         return k in self._down_keys
         
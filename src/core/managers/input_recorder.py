@@ -0,0 +1,91 @@
+import gzip
+import random
+import struct
+
+from src.utils import Logger
+from .input_manager import InputManager, InputSnapshot
+
+"""
+Input log format (gzip compressed):
+    header : magic b"I2PI", u8 version, u32 random seed
+    frame  : f64 dt, i16 mouse x, i16 mouse y, i8 wheel,
+             u8 mouse down / pressed / released bitmasks (bit n = button n + 1),
+             u8 number of down / pressed / released keys,
+             then that many u32 key codes
+"""
+
+MAGIC = b"I2PI"
+VERSION = 1
+_HEADER = struct.Struct("<4sBI")
+_FRAME = struct.Struct("<dhhbBBBBBB")
+
+
+def _mask(buttons: set[int]) -> int:
+    return sum(1 << (b - 1) for b in buttons if 1 <= b <= 8)
+
+
+def _unmask(mask: int) -> set[int]:
+    return {b + 1 for b in range(8) if mask & (1 << b)}
+
+
+class InputRecorder:
+    """Writes the input state and dt of every logic update to a compact binary log."""
+    seed: int
+    frames: int
+
+    def __init__(self, path: str):
+        self.seed = random.getrandbits(32)
+        self.frames = 0
+        self._file = gzip.open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, self.seed))
+        Logger.info(f"Recording input to {path}")
+
+    def record(self, dt: float, inputs: InputManager) -> None:
+        s = inputs.snapshot()
+        keys = (sorted(s.down_keys), sorted(s.pressed_keys), sorted(s.released_keys))
+        self._file.write(_FRAME.pack(
+            dt, s.mouse_pos[0], s.mouse_pos[1], max(-128, min(127, s.mouse_wheel)),
+            _mask(s.down_mouse), _mask(s.pressed_mouse), _mask(s.released_mouse),
+            *(len(k) for k in keys)
+        ))
+        for group in keys:
+            self._file.write(struct.pack(f"<{len(group)}I", *group))
+        self.frames += 1
+
+    def close(self) -> None:
+        self._file.close()
+        Logger.info(f"Recorded {self.frames} frames of input")
+
+
+class InputReplay:
+    """Feeds a log written by InputRecorder back into InputManager, one update at a time."""
+    seed: int
+    frames: int
+
+    def __init__(self, path: str):
+        with gzip.open(path, "rb") as f:
+            self._data = f.read()
+        magic, version, self.seed = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input log")
+        self._offset = _HEADER.size
+        self.frames = 0
+        Logger.info(f"Replaying input from {path}")
+
+    def next_frame(self, inputs: InputManager) -> float | None:
+        """Load the next frame into `inputs` and return its dt, or None at the end of the log."""
+        if self._offset >= len(self._data):
+            return None
+        dt, mx, my, wheel, m_down, m_pressed, m_released, *counts = _FRAME.unpack_from(self._data, self._offset)
+        self._offset += _FRAME.size
+        groups = []
+        for n in counts:
+            groups.append(set(struct.unpack_from(f"<{n}I", self._data, self._offset)))
+            self._offset += 4 * n
+        inputs.load_snapshot(InputSnapshot(
+            groups[0], groups[1], groups[2],
+            _unmask(m_down), _unmask(m_pressed), _unmask(m_released),
+            (mx, my), wheel
+        ))
+        self.frames += 1
+        return dt
@@ -1,34 +1,232 @@
 import pygame as pg
-from src.utils import load_img, load_font, load_sound
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable
+from src.utils import GameSettings, Logger, load_img, load_font, load_sound
+
+Asset = pg.Surface | pg.mixer.Sound
+
+def surface_bytes(surface: pg.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+def sound_bytes(sound: pg.mixer.Sound) -> int:
+    # Sounds are stored decoded in the mixer's format
+    init = pg.mixer.get_init()
+    if init is None:
+        return 0
+    frequency, fmt, channels = init
+    return int(sound.get_length() * frequency) * channels * (abs(fmt) // 8)
 
 class ResourceManager:
     """
     Make sure you are not loading the resource twice
     If the resource is already loaded, you can use the loaded image instead of loading it again.
+
+    Images and sounds share one LRU cache of at most RESOURCE_MEMORY_BUDGET bytes.
+    Pinned assets (e.g. those of the current scene) are never evicted. Evicting
+    only drops the cache's reference: whoever still holds the surface keeps it.
+    Scaled copies of images live in the same cache, so they are shared too and
+    must not be drawn on. Rendered text has its own LRU of TEXT_CACHE_SIZE entries.
     """
+    _cache: OrderedDict[tuple[str, Hashable], tuple[Asset, int]]    # (kind, key) -> (asset, bytes), oldest first
+    _pins: dict[tuple[str, Hashable], int]
+    _fonts: dict[tuple[str, int], pg.font.Font]
+    _sys_fonts: dict[tuple[str | None, int, bool, bool], pg.font.Font]
+    _texts: OrderedDict[tuple[pg.font.Font, str, tuple[int, ...], bool], pg.Surface]
+    memory_usage: int
+    hits: int               # Lookups in the asset LRU ...
+    misses: int
+    evictions: int
+    text_hits: int          # ... and in the rendered text LRU, counted apart
+    text_misses: int
+    text_evictions: int
+
     def __init__(self) -> None:
-        self._images: dict[str, pg.Surface] = {}
-        self._sounds: dict[str, pg.mixer.Sound] = {}
-        self._fonts: dict[tuple[str, int], pg.font.Font] = {}
+        self._cache = OrderedDict()
+        self._pins = {}
+        self._fonts = {}
+        self._sys_fonts = {}
+        self._texts = OrderedDict()
+        self.memory_usage = 0
+        self._reset_stats()
 
     def get_image(self, path: str) -> pg.Surface:
-        if path not in self._images:
-            self._images[path] = load_img(path)
-        return self._images[path]
+        image = self._get("image", path)
+        if image is None:
+            image = load_img(path)
+            self._add("image", path, image, surface_bytes(image))
+        return image
+
+    def get_scaled(
+        self, path: str, size: tuple[int, int],
+        smooth: bool = False, area: pg.Rect | None = None
+    ) -> pg.Surface:
+        """`path` (or the `area` of it, e.g. one frame of a sheet) resized to `size`, scaled once per key."""
+        key = (path, tuple(size), smooth, tuple(area) if area else None)
+        scaled = self._get("scaled", key)
+        if scaled is None:
+            image = self.get_image(path)
+            if area is not None:
+                image = image.subsurface(area)
+            scale = pg.transform.smoothscale if smooth else pg.transform.scale
+            scaled = scale(image, size)
+            self._add("scaled", key, scaled, surface_bytes(scaled))
+        return scaled
+
+    def has_image(self, path: str) -> bool:
+        return ("image", path) in self._cache
+
+    def add_image(self, path: str, image: pg.Surface) -> None:
+        """Store an image loaded elsewhere (e.g. by the AssetLoader)."""
+        self._add("image", path, image, surface_bytes(image))
+
+    def has_sound(self, path: str) -> bool:
+        return ("sound", path) in self._cache
+
+    def add_sound(self, path: str, sound: pg.mixer.Sound) -> None:
+        self._add("sound", path, sound, sound_bytes(sound))
 
     def get_sound(self, path: str) -> pg.mixer.Sound:
-        if path not in self._sounds:
-            self._sounds[path] = load_sound(path)
-        return self._sounds[path]
+        sound = self._get("sound", path)
+        if sound is None:
+            sound = load_sound(path)
+            self._add("sound", path, sound, sound_bytes(sound))
+        return sound
 
     def get_font(self, path: str, size: int) -> pg.font.Font:
+        # Fonts are small and don't report their size, so they stay out of the budget
         key = (path, size)
         if key not in self._fonts:
             self._fonts[key] = load_font(path, size)
         return self._fonts[key]
 
+    def get_layer(
+        self, key: Hashable, size: tuple[int, int], build: Callable[[pg.Surface], None],
+        colorkey: tuple[int, int, int] | None = None
+    ) -> pg.Surface:
+        """
+        A transparent `size` surface drawn once by `build` and reused, for static
+        overlay chrome (dimmed background, panel, title). Kept in the LRU like
+        scaled images and rebuilt if it was evicted. Don't draw on the result.
+
+        With `colorkey` the layer is an opaque display-format surface filled with
+        that color, which is left out when blitting. Much cheaper to blit than
+        per-pixel alpha, for chrome that has no translucent pixels.
+        """
+        key = (key, tuple(size), colorkey)
+        layer = self._get("layer", key)
+        if layer is None:
+            if colorkey is None:
+                layer = pg.Surface(size, pg.SRCALPHA)
+                build(layer)
+            else:
+                layer = pg.Surface(size, 0, pg.display.get_surface())
+                layer.fill(colorkey)
+                build(layer)
+                layer.set_colorkey(colorkey, pg.RLEACCEL)
+            self._add("layer", key, layer, surface_bytes(layer))
+        return layer
+
+    def get_dim_layer(self, size: tuple[int, int], color: tuple[int, int, int, int]) -> pg.Surface:
+        """A `size` surface filled with a translucent `color`, e.g. (0, 0, 0, 180) behind overlays."""
+        return self.get_layer(("dim", tuple(color)), size, lambda layer: layer.fill(color))
+
+    def get_sys_font(self, name: str | None, size: int, bold: bool = False, italic: bool = False) -> pg.font.Font:
+        """pg.font.SysFont, created once per (name, size, style) and shared."""
+        key = (name, size, bold, italic)
+        if key not in self._sys_fonts:
+            self._sys_fonts[key] = pg.font.SysFont(name, size, bold=bold, italic=italic)
+        return self._sys_fonts[key]
+
+    def render_text(self, font: pg.font.Font, text: str, color, antialias: bool = True) -> pg.Surface:
+        """font.render(), cached per (font, text, color, antialias). The surface is shared: don't draw on it."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._texts.get(key)
+        if surface is not None:
+            self.text_hits += 1
+            self._texts.move_to_end(key)
+            return surface
+        self.text_misses += 1
+        surface = self._texts[key] = font.render(text, antialias, color)
+        if len(self._texts) > GameSettings.TEXT_CACHE_SIZE:
+            self._texts.popitem(last=False)
+            self.text_evictions += 1
+        return surface
+
+    def pin(self, images: Iterable[str] = (), sounds: Iterable[str] = ()) -> None:
+        """Keep these assets cached until they are unpinned. Pins are counted."""
+        for key in [("image", p) for p in images] + [("sound", p) for p in sounds]:
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, images: Iterable[str] = (), sounds: Iterable[str] = ()) -> None:
+        for key in [("image", p) for p in images] + [("sound", p) for p in sounds]:
+            count = self._pins.get(key, 0) - 1
+            if count > 0:
+                self._pins[key] = count
+            else:
+                self._pins.pop(key, None)
+        self._evict()
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        text_lookups = self.text_hits + self.text_misses
+        return {
+            "entries": len(self._cache),
+            "texts": len(self._texts),
+            "bytes": self.memory_usage,
+            "budget": GameSettings.RESOURCE_MEMORY_BUDGET,
+            "pinned": len(self._pins),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "text_hits": self.text_hits,
+            "text_misses": self.text_misses,
+            "text_evictions": self.text_evictions,
+            "text_hit_rate": self.text_hits / text_lookups if text_lookups else 0.0,
+        }
+
     def clear(self) -> None:
-        """Clear all cached assets (useful when switching levels)."""
-        self._images.clear()
-        self._sounds.clear()
+        """Clear all cached assets, pins and statistics (useful when switching levels)."""
+        self._cache.clear()
+        self._pins.clear()
         self._fonts.clear()
+        self._sys_fonts.clear()
+        self._texts.clear()
+        self.memory_usage = 0
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.text_hits = 0
+        self.text_misses = 0
+        self.text_evictions = 0
+
+    def _get(self, kind: str, path: Hashable) -> Asset | None:
+        entry = self._cache.get((kind, path))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._cache.move_to_end((kind, path))
+        return entry[0]
+
+    def _add(self, kind: str, path: Hashable, asset: Asset, size: int) -> None:
+        key = (kind, path)
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self.memory_usage -= old[1]
+        self._cache[key] = (asset, size)
+        self.memory_usage += size
+        self._evict(keep=key)
+
+    def _evict(self, keep: tuple[str, Hashable] | None = None) -> None:
+        for key in list(self._cache):
+            if self.memory_usage <= GameSettings.RESOURCE_MEMORY_BUDGET:
+                break
+            if key == keep or key in self._pins:
+                continue
+            self.memory_usage -= self._cache.pop(key)[1]
+            self.evictions += 1
+            Logger.debug(f"Evicted {key[0]} {key[1]} ({self.memory_usage / 2**20:.1f} MiB of assets still cached)")
@@ -1,23 +1,78 @@
+import time
 import pygame as pg
+from typing import Callable
 
 from src.scenes.scene import Scene
 from src.utils import Logger
+from .asset_loader import AssetManifest
+
+SceneFactory = Callable[[], Scene]
 
 class SceneManager:
     
-    _scenes: dict[str, Scene]
+    _scenes: dict[str, Scene]               # Scenes that have been constructed
+    _factories: dict[str, SceneFactory]     # Scenes registered lazily, built on first visit
+    _unload_after: dict[str, float]         # Seconds a lazy scene may stay unvisited before it is dropped
+    _last_visit: dict[str, float]           # perf_counter() when each scene was last left
+    _current_name: str | None = None
     _current_scene: Scene | None = None
     _next_scene: str | None = None
+    _full_redraw: bool = True
+    # Fraction of a logic step elapsed since the last update, for smoothing draws
+    interpolation: float = 1.0
     
     def __init__(self):
         Logger.info("Initializing SceneManager")
         self._scenes = {}
+        self._factories = {}
+        self._unload_after = {}
+        self._last_visit = {}
         
-    def register_scene(self, name: str, scene: Scene) -> None:
-        self._scenes[name] = scene
+    def register_scene(self, name: str, scene: Scene | SceneFactory, unload_after: float | None = None) -> None:
+        """
+        Register a scene instance, or a factory (usually the scene class) that is
+        only called the first time the scene is entered. A lazy scene with
+        `unload_after` is dropped once it has not been visited for that many
+        seconds and rebuilt on the next visit, so only use it for scenes that
+        keep no state between visits.
+        """
+        if not callable(scene):
+            self._scenes[name] = scene
+            return
+        self._factories[name] = scene
+        self._scenes.pop(name, None)
+        if unload_after is not None:
+            self._unload_after[name] = unload_after
+
+    def get_scene(self, name: str) -> Scene:
+        """The scene called `name`, constructing it if it is registered lazily."""
+        scene = self._scenes.get(name)
+        if scene is None:
+            if name not in self._factories:
+                raise ValueError(f"Scene '{name}' not found")
+            start = time.perf_counter()
+            scene = self._scenes[name] = self._factories[name]()
+            Logger.info(f"Built {name} scene in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return scene
+
+    def is_built(self, name: str) -> bool:
+        return name in self._scenes
+
+    def manifest(self, name: str) -> AssetManifest | None:
+        """The AssetManifest declared by a scene (or its factory), if any."""
+        return getattr(self._scenes.get(name) or self._factories.get(name), "ASSETS", None)
+
+    def warm_up(self, name: str) -> None:
+        """Start decoding a scene's images in the background so building it later is cheap."""
+        from src.core.services import asset_loader
+
+        manifest = self.manifest(name)
+        if manifest is not None and not self.is_built(name):
+            # Sounds are left out: decoding one holds the mixer and stalls playback
+            asset_loader.load(AssetManifest(images=manifest.images))
         
     def change_scene(self, scene_name: str) -> None:
-        if scene_name in self._scenes:
+        if scene_name in self._scenes or scene_name in self._factories:
             Logger.info(f"Changing scene to '{scene_name}'")
             self._next_scene = scene_name
         else:
@@ -35,16 +90,40 @@ class SceneManager:
     def draw(self, screen: pg.Surface) -> None:
         if self._current_scene:
             self._current_scene.draw(screen)
+
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        """Regions to redraw this frame, or None for the whole screen."""
+        # Scenes that don't subclass Scene always redraw everything
+        dirty_rects = getattr(self._current_scene, "dirty_rects", None)
+        rects = dirty_rects() if dirty_rects else None
+        if self._full_redraw:
+            self._full_redraw = False
+            return None
+        return rects
+
+    def invalidate(self) -> None:
+        """Force the next frame to redraw the whole screen."""
+        self._full_redraw = True
             
     def _perform_scene_switch(self) -> None:
         if self._next_scene is None:
             return
             
+        from src.core.services import resource_manager, sound_manager
+
         # Exit current scene
         if self._current_scene:
             self._current_scene.exit()
+            self._last_visit[self._current_name] = time.perf_counter()
+            # The scene's assets may be evicted again once it is no longer shown
+            if (manifest := self.manifest(self._current_name)) is not None:
+                resource_manager.unpin(manifest.images, manifest.sounds + manifest.music)
         
-        self._current_scene = self._scenes[self._next_scene]
+        self._current_name = self._next_scene
+        self._current_scene = self.get_scene(self._next_scene)
+        if (manifest := self.manifest(self._current_name)) is not None:
+            resource_manager.pin(manifest.images, manifest.sounds + manifest.music)
+            sound_manager.preload(manifest.sounds)
         
         # Enter new scene
         if self._current_scene:
@@ -53,4 +132,15 @@ class SceneManager:
             
         # Clear the transition request
         self._next_scene = None
+        self._full_redraw = True
+        self._unload_stale()
+
+    def _unload_stale(self) -> None:
+        now = time.perf_counter()
+        for name, seconds in self._unload_after.items():
+            if name == self._current_name or name not in self._scenes:
+                continue
+            if now - self._last_visit.get(name, now) >= seconds:
+                Logger.info(f"Unloading {name} scene, unused for {seconds:.0f}s")
+                del self._scenes[name]
         
\ No newline at end of file
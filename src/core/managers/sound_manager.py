@@ -1,34 +1,101 @@
+import time
 import pygame as pg
-from src.utils import load_sound, GameSettings
+from typing import Iterable
+from src.utils import GameSettings, Logger
+from src.utils.loader import ASSETS_DIR
 
 class SoundManager:
+    """
+    Music is streamed from disk with pg.mixer.music (STREAM_BGM), or decoded and
+    looped on a reserved channel. Sound effects are decoded once through the
+    ResourceManager and share the remaining channels by priority: when every
+    channel is busy, a new sound replaces the oldest one of the lowest priority
+    below its own, or is dropped.
+    """
+    current_bgm: pg.mixer.Sound | None      # Decoded BGM, when not streaming
+    current_bgm_path: str | None
+    _bgm_channel: pg.mixer.Channel
+    _channels: list[pg.mixer.Channel]       # Channels for sound effects
+    _priorities: list[int]                  # Priority of what each channel last played
+    _started: list[float]                   # When each channel started it
+
     def __init__(self):
         pg.mixer.init()
         pg.mixer.set_num_channels(GameSettings.MAX_CHANNELS)
+        # Channel 0 only plays decoded BGM, so effects never cut the music
+        pg.mixer.set_reserved(1)
+        self._bgm_channel = pg.mixer.Channel(0)
+        self._channels = [pg.mixer.Channel(i) for i in range(1, GameSettings.MAX_CHANNELS)]
+        self._priorities = [0] * len(self._channels)
+        self._started = [0.0] * len(self._channels)
         self.current_bgm = None
-        
+        self.current_bgm_path = None
+
     def play_bgm(self, filepath: str):
-        if self.current_bgm:
-            self.current_bgm.stop()
-        audio = load_sound(filepath)
-        audio.set_volume(GameSettings.AUDIO_VOLUME)
-        audio.play(-1)
-        self.current_bgm = audio
-        
+        self.stop_bgm()
+        if GameSettings.STREAM_BGM:
+            pg.mixer.music.load(str(ASSETS_DIR / "sounds" / filepath))
+            pg.mixer.music.set_volume(GameSettings.AUDIO_VOLUME)
+            pg.mixer.music.play(-1)
+        else:
+            from src.core.services import resource_manager
+            # Cached so scenes can preload their music and re-entering doesn't decode it again
+            audio = resource_manager.get_sound(filepath)
+            audio.set_volume(GameSettings.AUDIO_VOLUME)
+            self._bgm_channel.play(audio, -1)
+            self.current_bgm = audio
+        self.current_bgm_path = filepath
+
+    def stop_bgm(self):
+        pg.mixer.music.stop()
+        self._bgm_channel.stop()
+        self.current_bgm = None
+        self.current_bgm_path = None
+
     def pause_all(self):
         pg.mixer.pause()
+        pg.mixer.music.pause()
 
     def resume_all(self):
         pg.mixer.unpause()
-        
-    def play_sound(self, filepath, volume=0.7):
-        sound = load_sound(filepath)
-        sound.set_volume(volume)
-        sound.play()
+        pg.mixer.music.unpause()
+
+    def preload(self, sounds: Iterable[str]) -> None:
+        """Decode sound effects now (e.g. a scene's manifest) so playing them later doesn't hit the disk."""
+        from src.core.services import resource_manager
+        for path in sounds:
+            resource_manager.get_sound(path)
+
+    def play_sound(self, filepath, volume=0.7, priority: int = 0) -> pg.mixer.Channel | None:
+        from src.core.services import resource_manager
+        sound = resource_manager.get_sound(filepath)
+        index = self._allocate_channel(priority)
+        if index is None:
+            Logger.debug(f"No channel free for {filepath} (priority {priority})")
+            return None
+        channel = self._channels[index]
+        channel.set_volume(volume)
+        channel.play(sound)
+        self._priorities[index] = priority
+        self._started[index] = time.perf_counter()
+        return channel
+
+    def _allocate_channel(self, priority: int) -> int | None:
+        victim = None
+        for i, channel in enumerate(self._channels):
+            if not channel.get_busy():
+                return i
+            if self._priorities[i] >= priority:
+                continue
+            if victim is None or (self._priorities[i], self._started[i]) < (self._priorities[victim], self._started[victim]):
+                victim = i
+        return victim
 
     def stop_all_sounds(self):
         pg.mixer.stop()
+        pg.mixer.music.stop()
         self.current_bgm = None
+        self.current_bgm_path = None
 
     # ★★★ 新增這個 ★★★
     def set_volume(self, volume: float):
@@ -36,5 +103,6 @@ class SoundManager:
         volume = max(0.0, min(1.0, volume))  # clamp
         GameSettings.AUDIO_VOLUME = volume
 
+        pg.mixer.music.set_volume(volume)
         if self.current_bgm is not None:
             self.current_bgm.set_volume(volume)
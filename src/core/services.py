@@ -1,6 +1,7 @@
-from .managers import InputManager, ResourceManager, SceneManager, SoundManager
+from .managers import InputManager, ResourceManager, SceneManager, SoundManager, AssetLoader
 
 input_manager = InputManager()
 resource_manager = ResourceManager()
+asset_loader = AssetLoader(resource_manager)
 scene_manager = SceneManager()
 sound_manager = SoundManager()
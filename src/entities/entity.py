@@ -4,12 +4,14 @@ from typing import override
 from src.sprites import Animation
 from src.utils import Position, PositionCamera, Direction, GameSettings
 from src.core import GameManager
+from src.core.services import scene_manager
 
 
 class Entity:
     animation: Animation
     direction: Direction
     position: Position
+    prev_position: Position     # Position at the start of the current logic step
     game_manager: GameManager
     
     def __init__(self, x: float, y: float, game_manager: GameManager) -> None:
@@ -20,6 +22,7 @@ class Entity:
         )
         
         self.position = Position(x, y)
+        self.prev_position = self.position.copy()
         self.direction = Direction.DOWN
         self.animation.update_pos(self.position)
         self.game_manager = game_manager
@@ -27,11 +30,27 @@ class Entity:
     def update(self, dt: float) -> None:
         self.animation.update_pos(self.position)
         self.animation.update(dt)
+
+    def begin_step(self) -> None:
+        """Remember where this logic step started, so draws can interpolate from it."""
+        self.prev_position = self.position.copy()
+
+    @property
+    def render_position(self) -> Position:
+        t = scene_manager.interpolation
+        prev, cur = self.prev_position, self.position
+        # Teleports and grid snaps jump, don't slide across them
+        if abs(cur.x - prev.x) > GameSettings.TILE_SIZE or abs(cur.y - prev.y) > GameSettings.TILE_SIZE:
+            return cur
+        return Position(prev.x + (cur.x - prev.x) * t, prev.y + (cur.y - prev.y) * t)
         
     def draw(self, screen: pg.Surface, camera: PositionCamera) -> None:
+        self.animation.update_pos(self.render_position)
         self.animation.draw(screen, camera)
         if GameSettings.DRAW_HITBOXES:
             self.animation.draw_hitbox(screen, camera)
+        # The animation rect doubles as a hitbox, put it back on the logic position
+        self.animation.update_pos(self.position)
         
     @staticmethod
     def _snap_to_grid(value: float) -> int:
@@ -1,3 +1,4 @@
 from .button import Button
+from .widget import Widget, Label, Icon, Panel
 
 from .component import UIComponent
\ No newline at end of file
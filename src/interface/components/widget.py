@@ -0,0 +1,164 @@
+import pygame as pg
+from abc import ABC, abstractmethod
+from typing import Callable, Hashable, Sequence, TypeVar
+
+from src.core.services import resource_manager
+
+T = TypeVar("T")
+Dynamic = T | Callable[[], T]   # A value, or a function returning the current value
+
+
+# Color of the parts of a colorkey layer that are left out (Panel's rounded corners)
+CHROMA_KEY = (255, 0, 255)
+
+
+def _value(value: Dynamic[T]) -> T:
+    return value() if callable(value) else value
+
+
+class Widget(ABC):
+    """
+    Retained-mode UI element. The rendered surface is kept and render() only
+    runs again when state() returns something different, so a widget that
+    doesn't change costs a blit per frame.
+    """
+    rect: pg.Rect
+    _surface: pg.Surface | None
+    _state: Hashable
+
+    def __init__(self, rect: pg.Rect | tuple[int, int, int, int]):
+        self.rect = pg.Rect(rect)
+        self._surface = None
+        self._state = None
+
+    def state(self) -> Hashable:
+        """Everything the appearance depends on."""
+        return None
+
+    @abstractmethod
+    def render(self) -> pg.Surface:
+        """Draw the widget's current appearance."""
+
+    @property
+    def surface(self) -> pg.Surface:
+        state = self.state()
+        if self._surface is None or state != self._state:
+            self._surface = self.render()
+            self._state = state
+        return self._surface
+
+    def invalidate(self) -> None:
+        self._surface = None
+
+    def update(self, dt: float) -> None:
+        pass
+
+    def draw(self, screen: pg.Surface) -> None:
+        screen.blit(self.surface, self.rect)
+
+
+class Label(Widget):
+    """A line of text at `pos` (top left). Text and color may be functions, e.g. to show a counter."""
+    font: pg.font.Font
+    text: Dynamic[str]
+    color: Dynamic[tuple[int, int, int]]
+
+    def __init__(self, font: pg.font.Font, text: Dynamic[str], color: Dynamic[tuple[int, int, int]], pos: tuple[int, int]):
+        super().__init__((pos, (0, 0)))
+        self.font = font
+        self.text = text
+        self.color = color
+
+    def state(self) -> Hashable:
+        return (_value(self.text), tuple(_value(self.color)))
+
+    def render(self) -> pg.Surface:
+        surface = resource_manager.render_text(self.font, _value(self.text), _value(self.color))
+        self.rect.size = surface.get_size()
+        return surface
+
+
+class Icon(Widget):
+    """An image from assets/images scaled to `size`."""
+    def __init__(self, path: str, size: tuple[int, int], pos: tuple[int, int]):
+        super().__init__((pos, size))
+        self.path = path
+
+    def render(self) -> pg.Surface:
+        return resource_manager.get_scaled(self.path, self.rect.size)
+
+
+class Panel(Widget):
+    """
+    An overlay panel: the screen around it dimmed, a rounded box with a border
+    and whatever fixed content `build` draws on it (in panel coordinates),
+    then the child widgets on top. The box is opaque, so it is cached through
+    resource_manager as a colorkey layer and only the screen outside it gets
+    the translucent dim. Dim and box are looked up each frame so the LRU stays
+    in charge of them; each child keeps its own surface and only re-renders
+    when its state changes. Interactive widgets (buttons) are drawn over it
+    by the overlay.
+    """
+    key: Hashable
+    build: Callable[[pg.Surface], None]
+    children: list[Widget]
+    fill: tuple[int, int, int]
+    border: tuple[int, int, int]
+    border_width: int
+    radius: int
+    dim: tuple[int, int, int, int] | None
+    _dim_rects: tuple[tuple[int, int], list[pg.Rect]] | None    # (screen size, rects to dim)
+
+    def __init__(
+        self, key: Hashable, rect: pg.Rect | tuple[int, int, int, int], build: Callable[[pg.Surface], None],
+        children: Sequence[Widget] = (), fill: tuple[int, int, int] = (240, 240, 240),
+        border: tuple[int, int, int] = (0, 0, 0), border_width: int = 2, radius: int = 12,
+        dim: tuple[int, int, int, int] | None = (0, 0, 0, 180)
+    ):
+        super().__init__(rect)
+        self.key = key
+        self.build = build
+        self.children = list(children)
+        self.fill = fill
+        self.border = border
+        self.border_width = border_width
+        self.radius = radius
+        self.dim = dim
+        self._dim_rects = None
+
+    def _build_box(self, layer: pg.Surface) -> None:
+        box = layer.get_rect()
+        pg.draw.rect(layer, self.fill, box, border_radius=self.radius)
+        pg.draw.rect(layer, self.border, box, self.border_width, border_radius=self.radius)
+        self.build(layer)
+
+    def render(self) -> pg.Surface:
+        return resource_manager.get_layer(self.key, self.rect.size, self._build_box, colorkey=CHROMA_KEY)
+
+    def dim_rects(self, screen_size: tuple[int, int]) -> list[pg.Rect]:
+        """The parts of the screen the box doesn't cover: four strips around it and its rounded corners."""
+        if self._dim_rects is None or self._dim_rects[0] != screen_size:
+            w, h = screen_size
+            r, c = self.rect, self.radius
+            rects = [
+                pg.Rect(0, 0, w, r.top), pg.Rect(0, r.bottom, w, h - r.bottom),
+                pg.Rect(0, r.top, r.left, r.height), pg.Rect(r.right, r.top, w - r.right, r.height),
+                pg.Rect(r.left, r.top, c, c), pg.Rect(r.right - c, r.top, c, c),
+                pg.Rect(r.left, r.bottom - c, c, c), pg.Rect(r.right - c, r.bottom - c, c, c),
+            ]
+            self._dim_rects = (screen_size, [rect for rect in rects if rect.width > 0 and rect.height > 0])
+        return self._dim_rects[1]
+
+    def update(self, dt: float) -> None:
+        for child in self.children:
+            child.update(dt)
+
+    def draw(self, screen: pg.Surface) -> None:
+        if self.dim is not None:
+            size = screen.get_size()
+            dim = resource_manager.get_dim_layer(size, self.dim)
+            for rect in self.dim_rects(size):
+                screen.blit(dim, rect, rect)
+        screen.blit(self.render(), self.rect)
+        for child in self.children:
+            child.draw(screen)
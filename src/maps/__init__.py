@@ -1 +1,2 @@
-from .map import Map
\ No newline at end of file
+from .map import Map
+from .tile_triggers import TileTriggers
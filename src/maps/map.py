@@ -1,45 +1,211 @@
+import os
 import pygame as pg
 import pytmx
+from dataclasses import dataclass
 
-from src.utils import load_tmx, Position, GameSettings, PositionCamera, Teleport
+from src.utils import load_tmx, parse_tmx, load_tmx_images, Position, GameSettings, PositionCamera, Teleport, profiler
+from .tile_triggers import TileTriggers
+from .map_cache import BakedMap, load_baked, save_baked, surface_to_cell, surface_from_cell
+
+# Overlay layers are baked in square chunks of this many tiles
+OVERLAY_CHUNK = 8
+
+# Scaled tile images shared by every Map that uses the same tileset image.
+# Key: (tileset image path, tile index inside the tileset, flip flags, tile size)
+# Only used while baking, which runs on the main thread (the prefetch worker only decodes files)
+_scaled_tiles: dict[tuple[str, int, object, int], pg.Surface] = {}
+
+@dataclass
+class MapInfo:
+    """
+    What the game needs to know about a map without loading it:
+    where it is, where it teleports to and where the player spawns.
+    """
+    path: str
+    teleporters: list[Teleport]
+    spawn: Position
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MapInfo":
+        tp = [Teleport.from_dict(t) for t in data.get("teleport", [])]
+        pos = Position(data["player"]["x"] * GameSettings.TILE_SIZE, data["player"]["y"] * GameSettings.TILE_SIZE)
+        return cls(data["path"], tp, pos)
+
+    def to_dict(self):
+        return {
+            "path": self.path,
+            "teleport": [t.to_dict() for t in self.teleporters],
+            "player": {
+                "x": self.spawn.x // GameSettings.TILE_SIZE,
+                "y": self.spawn.y // GameSettings.TILE_SIZE,
+            }
+        }
+
+def decode_map(path: str) -> BakedMap | pytmx.TiledMap:
+    """
+    The file work of loading a map, without creating any pygame surface: the
+    baked map from the disk cache if there is one, otherwise the parsed TMX
+    without its tile images. Safe on a worker thread; pass the result to
+    Map / Map.from_info on the main thread to build the surfaces.
+    """
+    baked = load_baked(path)
+    return baked if baked is not None else parse_tmx(path)
 
 class Map:
     # Map Properties
     path_name: str
-    tmxdata: pytmx.TiledMap
+    _tmxdata: pytmx.TiledMap | None
     # Position Argument
     spawn: Position
     teleporters: list[Teleport]
+    triggers: TileTriggers
     # Rendering Properties
     _surface: pg.Surface
+    _overlay: list[tuple[pg.Rect, pg.Surface]]
     _collision_map: list[pg.Rect]
+    _tile_images: dict[int, pg.Surface | None]
+    _cell: int                              # Source pixels per tile: the baked surfaces are their nearest-neighbour upscale
+    _mips: list[tuple[pg.Surface, float]]   # Map and overlay at 1/2, 1/4, 1/8, ... size and that scale
+    _walkable: dict[int, bytearray]         # Walkability grid per inset margin, built on first use
 
-    def __init__(self, path: str, tp: list[Teleport], spawn: Position):
+    def __init__(self, path: str, tp: list[Teleport], spawn: Position,
+                 decoded: "BakedMap | pytmx.TiledMap | None" = None):
         self.path_name = path
-        self.tmxdata = load_tmx(path)
+        self._tmxdata = None
         self.spawn = spawn
         self.teleporters = tp
+        self.triggers = TileTriggers()
+        for teleport in tp:
+            self.triggers.add(
+                "teleport",
+                teleport.pos.x // GameSettings.TILE_SIZE,
+                teleport.pos.y // GameSettings.TILE_SIZE,
+                teleport
+            )
+
+        self._tile_images = {}
+        self._mips = []
+        self._walkable = {}
 
+        # A baked copy on disk lets us skip pytmx and tile baking entirely.
+        # decode_map may already have done the file work on another thread.
+        if decoded is None:
+            decoded = load_baked(path)
+        if isinstance(decoded, BakedMap):
+            self._load_baked(decoded)
+        else:
+            if decoded is not None:
+                self._tmxdata = load_tmx_images(decoded)
+            self._bake()
+            save_baked(path, self._to_baked())
+
+        # Built with the map so the minimap never waits for it
+        self._build_mips()
+
+    def _bake(self) -> None:
         pixel_w = self.tmxdata.width * GameSettings.TILE_SIZE
         pixel_h = self.tmxdata.height * GameSettings.TILE_SIZE
 
-        # Prebake the map
-        self._surface = pg.Surface((pixel_w, pixel_h), pg.SRCALPHA)
+        # Prebake the map: opaque base in display format, sparse alpha overlay on top
+        self._surface = pg.Surface((pixel_w, pixel_h), 0, pg.display.get_surface())
+        self._overlay = []
         self._render_all_layers(self._surface)
         # Prebake the collision map
-        self._collision_map = self._create_collision_map()
+        self.set_collision(self._create_collision_map())
+
+        ts = GameSettings.TILE_SIZE
+        tmx = self.tmxdata
+        # Tiles are upscaled with nearest neighbour, so when TILE_SIZE is a multiple
+        # of the source tile size the map holds no more detail than the source tiles
+        if tmx.tilewidth == tmx.tileheight and ts % tmx.tilewidth == 0:
+            self._cell = tmx.tilewidth
+        else:
+            self._cell = ts
+
+    @property
+    def tmxdata(self) -> pytmx.TiledMap:
+        # Only parsed when the map has to be baked (or someone asks for it)
+        if self._tmxdata is None:
+            self._tmxdata = load_tmx(self.path_name)
+        return self._tmxdata
 
     def update(self, dt: float):
         return
 
     def draw(self, screen: pg.Surface, camera: PositionCamera):
-        screen.blit(self._surface, camera.transform_position(Position(0, 0)))
-        
-        # Draw the hitboxes collision map
-        if GameSettings.DRAW_HITBOXES:
-            for rect in self._collision_map:
-                pg.draw.rect(screen, (255, 0, 0), camera.transform_rect(rect), 1)
+        with profiler.section("draw.map"):
+            screen.blit(self._surface, camera.transform_position(Position(0, 0)))
+            
+            # Draw the hitboxes collision map
+            if GameSettings.DRAW_HITBOXES:
+                for rect in self._collision_map:
+                    pg.draw.rect(screen, (255, 0, 0), camera.transform_rect(rect), 1)
+
+    def draw_overlay(self, screen: pg.Surface, camera: PositionCamera):
+        for rect, chunk in self._overlay:
+            screen.blit(chunk, camera.transform_rect(rect))
         
+    @property
+    def pixel_size(self) -> tuple[int, int]:
+        return self._surface.get_size()
+
+    def _shrink(self, tile_px: int):
+        """
+        How to scale the map down to `tile_px` pixels per tile. While that is still
+        a whole number of source pixels, every output pixel averages a block of
+        identical pixels, so plain scale gives what smoothscale would, much faster.
+        """
+        if GameSettings.TILE_SIZE % tile_px == 0 and tile_px % self._cell == 0:
+            return pg.transform.scale
+        return pg.transform.smoothscale
+
+    def thumbnail(self, tile_px: int) -> pg.Surface:
+        """
+        The map with its overlay layers at `tile_px` pixels per tile, e.g. for the
+        minimap. Scaled down from the baked base and chunks one by one, so the
+        map is never composed at full size.
+        """
+        ts = GameSettings.TILE_SIZE
+        width, height = self._surface.get_width() // ts, self._surface.get_height() // ts
+        shrink = self._shrink(tile_px)
+        thumb = shrink(self._surface, (width * tile_px, height * tile_px))
+        for rect, chunk in self._overlay:
+            size = (rect.width // ts * tile_px, rect.height // ts * tile_px)
+            thumb.blit(shrink(chunk, size), (rect.x // ts * tile_px, rect.y // ts * tile_px))
+        return thumb
+
+    def _build_mips(self) -> None:
+        with profiler.section("map.mips"):
+            ts = GameSettings.TILE_SIZE
+            width, height = self._surface.get_width() // ts, self._surface.get_height() // ts
+            tile_px = ts // 2
+            level = self.thumbnail(tile_px)
+            self._mips = [(level, tile_px / ts)]
+            while tile_px > 1:
+                tile_px //= 2
+                level = self._shrink(tile_px)(level, (width * tile_px, height * tile_px))
+                self._mips.append((level, tile_px / ts))
+
+    def mip(self, scale: float) -> tuple[pg.Surface, float]:
+        """
+        The smallest level of the map's mip pyramid that is still at least `scale`
+        times the map's size, and the scale of that level. Levels go down by half
+        until a tile is one pixel; together they hold about a third of the base.
+        """
+        for level, level_scale in reversed(self._mips):
+            if level_scale >= scale:
+                return level, level_scale
+        return self._mips[0]
+
+    def memory_usage(self) -> int:
+        """Bytes held by the baked surfaces of this map."""
+        size = self._surface.get_pitch() * self._surface.get_height()
+        for _, chunk in self._overlay:
+            size += chunk.get_pitch() * chunk.get_height()
+        for level, _ in self._mips:
+            size += level.get_pitch() * level.get_height()
+        return size
+
     def check_collision(self, rect: pg.Rect) -> bool:
         '''
         [TODO HACKATHON 4]
@@ -50,6 +216,31 @@ class Map:
                 return True
         return False
         
+    def set_collision(self, rects: list[pg.Rect]) -> None:
+        """Replace the collision rects. Walkability grids are rebuilt on next use."""
+        self._collision_map = rects
+        self._walkable = {}
+
+    def walkability(self, margin: int = 0) -> tuple[bytearray, int, int]:
+        """
+        Which tiles can be walked on, for pathfinding: a row-major bytearray
+        (1 = walkable) and the map's width and height in tiles. A tile is blocked
+        when a collision rect overlaps it shrunk by `margin` pixels on each side.
+        """
+        ts = GameSettings.TILE_SIZE
+        width, height = self._surface.get_width() // ts, self._surface.get_height() // ts
+        grid = self._walkable.get(margin)
+        if grid is None:
+            grid = bytearray(b"\x01") * (width * height)
+            for rect in self._collision_map:
+                # Only the tiles whose inset area can reach the rect
+                for y in range(max(0, (rect.top + margin) // ts - 1), min(height, (rect.bottom - margin) // ts + 1)):
+                    for x in range(max(0, (rect.left + margin) // ts - 1), min(width, (rect.right - margin) // ts + 1)):
+                        if rect.colliderect((x * ts + margin, y * ts + margin, ts - margin * 2, ts - margin * 2)):
+                            grid[y * width + x] = 0
+            self._walkable[margin] = grid
+        return grid, width, height
+
     def check_teleport(self, pos: Position) -> Teleport | None:
         """
         [TODO HACKATHON 6]
@@ -60,34 +251,87 @@ class Map:
         Args:
             pos: The player's position (x, y) in pixel coordinates.
         """
-        
-        for teleport in self.teleporters:
-            if teleport.pos.x//GameSettings.TILE_SIZE!=pos.x//GameSettings.TILE_SIZE:
-                continue 
-            if teleport.pos.y//GameSettings.TILE_SIZE!=pos.y//GameSettings.TILE_SIZE:
-                continue 
-            return teleport
+        return self.triggers.at("teleport", pos)
 
     def _render_all_layers(self, target: pg.Surface) -> None:
+        overlay_layers: list[pytmx.TiledTileLayer] = []
         for layer in self.tmxdata.visible_layers:
             # pytmx exposes TiledTileLayer as pytmx.TiledTileLayer
             if isinstance(layer, pytmx.TiledTileLayer):
-                self._render_tile_layer(target, layer)
+                # Everything below the entities is flattened into the opaque base,
+                # only layers flagged "overlay" in Tiled keep their alpha at runtime
+                if layer.properties.get("overlay", False):
+                    overlay_layers.append(layer)
+                else:
+                    self._render_tile_layer(target, layer)
             # image layers handled by pytmx if needed (left commented out like original)
             # elif isinstance(layer, pytmx.TiledImageLayer) and layer.image:
             #        target.blit(layer.image, (layer.x or 0, layer.y or 0))
+        self._overlay = self._render_overlay_chunks(overlay_layers)
     
     def _render_tile_layer(self, target: pg.Surface, layer: pytmx.TiledTileLayer) -> None:
         for x, y, gid in layer:
             if gid == 0:
                 continue
-            image = self.tmxdata.get_tile_image_by_gid(gid)
+            image = self._get_scaled_tile(gid)
             if image is None:
                 continue
 
-            image = pg.transform.scale(image, (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE))
             target.blit(image, (x * GameSettings.TILE_SIZE, y * GameSettings.TILE_SIZE))
+
+    def _render_overlay_chunks(self, layers: list[pytmx.TiledTileLayer]) -> list[tuple[pg.Rect, pg.Surface]]:
+        """
+        Bake the overlay layers into OVERLAY_CHUNK x OVERLAY_CHUNK tile pieces,
+        keeping only the chunks that actually contain a tile.
+        """
+        ts = GameSettings.TILE_SIZE
+        chunk_px = OVERLAY_CHUNK * ts
+        chunks: dict[tuple[int, int], pg.Surface] = {}
+        for layer in layers:
+            for x, y, gid in layer:
+                if gid == 0:
+                    continue
+                image = self._get_scaled_tile(gid)
+                if image is None:
+                    continue
+
+                key = (x // OVERLAY_CHUNK, y // OVERLAY_CHUNK)
+                if key not in chunks:
+                    chunks[key] = pg.Surface((chunk_px, chunk_px), pg.SRCALPHA)
+                chunks[key].blit(image, ((x % OVERLAY_CHUNK) * ts, (y % OVERLAY_CHUNK) * ts))
+
+        return [
+            (pg.Rect(cx * chunk_px, cy * chunk_px, chunk_px, chunk_px), chunk)
+            for (cx, cy), chunk in chunks.items()
+        ]
     
+    def _get_scaled_tile(self, gid: int) -> pg.Surface | None:
+        """
+        Return the tile image for a pytmx gid scaled to TILE_SIZE.
+        gids are local to one TiledMap, so the shared cache is keyed by the
+        tileset image and the tile's index inside it instead.
+        """
+        if gid in self._tile_images:
+            return self._tile_images[gid]
+
+        image = self.tmxdata.get_tile_image_by_gid(gid)
+        if image is not None:
+            key = self._tile_cache_key(gid)
+            if key not in _scaled_tiles:
+                _scaled_tiles[key] = pg.transform.scale(image, (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE))
+            image = _scaled_tiles[key]
+
+        self._tile_images[gid] = image
+        return image
+
+    def _tile_cache_key(self, gid: int) -> tuple[str, int, object, int]:
+        tiled_gid = self.tmxdata.tiledgidmap[gid]
+        tileset = self.tmxdata.get_tileset_from_gid(gid)
+        # The tileset image path is relative to the map file
+        image_path = os.path.normpath(os.path.join(os.path.dirname(self.tmxdata.filename), tileset.source))
+        flags = next(f for g, f in self.tmxdata.gidmap[tiled_gid] if g == gid)
+        return (image_path, tiled_gid - tileset.firstgid, flags, GameSettings.TILE_SIZE)
+
     def _create_collision_map(self) -> list[pg.Rect]:
         rects = []
         for layer in self.tmxdata.visible_layers:
@@ -103,11 +347,42 @@ class Map:
                         rects.append(rect)
         return rects
 
+    def _to_baked(self) -> BakedMap:
+        ts = GameSettings.TILE_SIZE
+        tmx = self.tmxdata
+        # Stored at the source resolution, scaled back up on load
+        cell = self._cell
+        return BakedMap(
+            width=tmx.width,
+            height=tmx.height,
+            cell=cell,
+            base=surface_to_cell(self._surface, tmx.width, tmx.height, cell, "RGB"),
+            overlay=[
+                (rect.x // ts, rect.y // ts, OVERLAY_CHUNK,
+                 surface_to_cell(chunk, OVERLAY_CHUNK, OVERLAY_CHUNK, cell, "RGBA"))
+                for rect, chunk in self._overlay
+            ],
+            collision=[(rect.x // ts, rect.y // ts) for rect in self._collision_map],
+        )
+
+    def _load_baked(self, baked: BakedMap) -> None:
+        ts = GameSettings.TILE_SIZE
+        self._cell = baked.cell
+        self._surface = surface_from_cell(baked.base, baked.width, baked.height, baked.cell, "RGB")
+        self._overlay = [
+            (pg.Rect(x * ts, y * ts, size * ts, size * ts),
+             surface_from_cell(pixels, size, size, baked.cell, "RGBA"))
+            for x, y, size, pixels in baked.overlay
+        ]
+        self.set_collision([pg.Rect(x * ts, y * ts, ts, ts) for x, y in baked.collision])
+
+    @classmethod
+    def from_info(cls, info: MapInfo, decoded: "BakedMap | pytmx.TiledMap | None" = None) -> "Map":
+        return cls(info.path, info.teleporters, info.spawn, decoded)
+
     @classmethod
     def from_dict(cls, data: dict) -> "Map":
-        tp = [Teleport.from_dict(t) for t in data.get("teleport", [])]
-        pos = Position(data["player"]["x"] * GameSettings.TILE_SIZE, data["player"]["y"] * GameSettings.TILE_SIZE)
-        return cls(data["path"], tp, pos)
+        return cls.from_info(MapInfo.from_dict(data))
 
     def to_dict(self):
         return {
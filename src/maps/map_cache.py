@@ -0,0 +1,166 @@
+import hashlib
+import os
+import re
+import struct
+from dataclasses import dataclass
+
+import pygame as pg
+
+from src.utils import GameSettings, Logger
+from src.utils.loader import ASSETS_DIR
+
+# Bump whenever the layout of the cache file or the baking rules change
+CACHE_VERSION = 2
+
+# File layout, all little-endian:
+#   header     magic, version, width, height, cell (tiles / pixels), chunk count, collision count
+#   base       width * cell x height * cell RGB pixels (pg.image.tobytes)
+#   chunks     per chunk: x, y, size in tiles, then size * cell squared RGBA pixels
+#   collision  per colliding tile: x, y
+_MAGIC = b"NTMB"
+_HEADER = struct.Struct("<4sHHHHII")
+_CHUNK = struct.Struct("<HHH")
+_TILE = struct.Struct("<HH")
+
+_SOURCE_RE = re.compile(rb'source="([^"]+)"')
+
+
+@dataclass
+class BakedMap:
+    """
+    Everything Map needs to draw and collide, without going through pytmx.
+    Pixels are stored `cell` pixels per tile and scaled up to TILE_SIZE on load.
+    """
+    width: int                                      # in tiles
+    height: int                                     # in tiles
+    cell: int                                       # stored pixels per tile
+    base: bytes                                     # RGB pixels of the opaque base
+    overlay: list[tuple[int, int, int, bytes]]      # (x, y, size) in tiles + RGBA pixels
+    collision: list[tuple[int, int]]                # colliding tile coordinates
+
+
+def _cache_key(path: str) -> str:
+    """
+    Hash the TMX file, every TSX / image it references and TILE_SIZE.
+    Editing the map, its tileset or the tile size in Tiled invalidates the entry.
+    """
+    digest = hashlib.sha1(f"v{CACHE_VERSION}:{GameSettings.TILE_SIZE}".encode())
+    pending = [ASSETS_DIR / "maps" / path]
+    seen = set()
+    while pending:
+        file = pending.pop(0)
+        if file in seen:
+            continue
+        seen.add(file)
+        data = file.read_bytes()
+        digest.update(data)
+        if file.suffix in (".tmx", ".tsx"):
+            for source in _SOURCE_RE.findall(data):
+                pending.append(file.parent / source.decode())
+    return digest.hexdigest()
+
+
+def _cache_file(path: str, key: str) -> str:
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(GameSettings.MAP_CACHE_DIR, f"{name}-{key}.bin")
+
+
+def load_baked(path: str) -> BakedMap | None:
+    if not GameSettings.MAP_CACHE:
+        return None
+    try:
+        cache_file = _cache_file(path, _cache_key(path))
+        if not os.path.exists(cache_file):
+            return None
+        with open(cache_file, "rb") as f:
+            baked = _decode(f.read())
+    except Exception as e:
+        Logger.warning(f"Ignoring map cache for {path}: {e}")
+        return None
+    Logger.info(f"Loaded baked map from cache: {path}")
+    return baked
+
+
+def save_baked(path: str, baked: BakedMap) -> None:
+    if not GameSettings.MAP_CACHE:
+        return
+    try:
+        key = _cache_key(path)
+        os.makedirs(GameSettings.MAP_CACHE_DIR, exist_ok=True)
+        # Drop stale entries of the same map
+        prefix = os.path.splitext(os.path.basename(path))[0] + "-"
+        for old in os.listdir(GameSettings.MAP_CACHE_DIR):
+            if old.startswith(prefix) and old.endswith(".bin"):
+                os.remove(os.path.join(GameSettings.MAP_CACHE_DIR, old))
+
+        cache_file = _cache_file(path, key)
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(_encode(baked))
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        Logger.warning(f"Failed to write map cache for {path}: {e}")
+
+
+def _encode(baked: BakedMap) -> bytes:
+    parts = [
+        _HEADER.pack(_MAGIC, CACHE_VERSION, baked.width, baked.height, baked.cell,
+                     len(baked.overlay), len(baked.collision)),
+        baked.base,
+    ]
+    for x, y, size, pixels in baked.overlay:
+        parts.append(_CHUNK.pack(x, y, size))
+        parts.append(pixels)
+    for x, y in baked.collision:
+        parts.append(_TILE.pack(x, y))
+    return b"".join(parts)
+
+
+def _decode(data: bytes) -> BakedMap:
+    """Parse a cache file written by _encode. Raises ValueError if it is not one."""
+    view = memoryview(data)
+
+    def take(count: int) -> bytes:
+        nonlocal view
+        if len(view) < count:
+            raise ValueError("truncated cache file")
+        chunk, view = view[:count], view[count:]
+        return bytes(chunk)
+
+    magic, version, width, height, cell, chunk_count, collision_count = _HEADER.unpack(take(_HEADER.size))
+    if magic != _MAGIC:
+        raise ValueError("not a baked map file")
+    if version != CACHE_VERSION:
+        raise ValueError(f"cache version {version}, expected {CACHE_VERSION}")
+
+    base = take(width * cell * height * cell * 3)
+    overlay = []
+    for _ in range(chunk_count):
+        x, y, size = _CHUNK.unpack(take(_CHUNK.size))
+        overlay.append((x, y, size, take(size * cell * size * cell * 4)))
+    collision = [_TILE.unpack(take(_TILE.size)) for _ in range(collision_count)]
+    if view:
+        raise ValueError("trailing data in cache file")
+    return BakedMap(width, height, cell, base, overlay, collision)
+
+
+def surface_to_cell(surface: pg.Surface, tiles_w: int, tiles_h: int, cell: int, fmt: str) -> bytes:
+    """Downsample a baked surface to `cell` pixels per tile and return its raw pixels."""
+    size = (tiles_w * cell, tiles_h * cell)
+    if surface.get_size() != size:
+        surface = pg.transform.scale(surface, size)
+    return pg.image.tobytes(surface, fmt)
+
+
+def surface_from_cell(pixels: bytes, tiles_w: int, tiles_h: int, cell: int, fmt: str) -> pg.Surface:
+    """
+    Inverse of surface_to_cell: an opaque display-format surface for "RGB",
+    a per-pixel alpha surface for "RGBA", both at TILE_SIZE pixels per tile.
+    """
+    size = (tiles_w * GameSettings.TILE_SIZE, tiles_h * GameSettings.TILE_SIZE)
+    stored = pg.image.frombytes(pixels, (tiles_w * cell, tiles_h * cell), fmt)
+    if fmt == "RGBA":
+        return pg.transform.scale(stored.convert_alpha(), size)
+    target = pg.Surface(size, 0, pg.display.get_surface())
+    pg.transform.scale(stored.convert(target), size, target)
+    return target
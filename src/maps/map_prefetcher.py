@@ -0,0 +1,72 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytmx
+
+from src.utils import Logger
+from .map import Map, MapInfo, decode_map
+from .map_cache import BakedMap
+
+# One worker thread shared by every MapPrefetcher (loading a save makes a new
+# GameManager); created on first use, stopped by shutdown_prefetcher()
+_executor: ThreadPoolExecutor | None = None
+
+def _shared_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map-prefetch")
+    return _executor
+
+def shutdown_prefetcher() -> None:
+    """Drop queued prefetches and let the worker thread exit. Called when the engine quits."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+class MapPrefetcher:
+    """
+    Reads maps on a background thread before the player needs them.
+    The worker only does file work (decode_map: the cache file or the TMX
+    parse) and never touches pygame. The surfaces are built from its result
+    in collect() / wait(), which are called from the main thread.
+    """
+    _pending: dict[str, tuple[MapInfo, Future]]
+
+    def __init__(self):
+        self._pending = {}
+
+    def is_pending(self, key: str) -> bool:
+        return key in self._pending
+
+    def request(self, key: str, info: MapInfo) -> None:
+        if key in self._pending:
+            return
+        Logger.info(f"Prefetching map '{key}'")
+        self._pending[key] = (info, _shared_executor().submit(decode_map, info.path))
+
+    def collect(self) -> list[tuple[str, Map]]:
+        """Build the maps whose files finished decoding since the last call."""
+        done = [key for key, (_, future) in self._pending.items() if future.done()]
+        return [(key, m) for key in done if (m := self._result(key)) is not None]
+
+    def wait(self, key: str) -> Map | None:
+        """Block until a pending map is decoded and build it. None if it failed or was never requested."""
+        if key not in self._pending:
+            return None
+        return self._result(key)
+
+    def cancel(self) -> None:
+        """Forget every pending map, e.g. when this prefetcher's GameManager is replaced."""
+        for _, future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def _result(self, key: str) -> Map | None:
+        info, future = self._pending.pop(key)
+        try:
+            decoded: BakedMap | pytmx.TiledMap = future.result()
+            return Map.from_info(info, decoded)
+        except Exception as e:
+            Logger.warning(f"Failed to prefetch map '{key}': {e}")
+            return None
@@ -0,0 +1,43 @@
+import pygame as pg
+
+from src.utils import GameSettings, Position
+
+
+class TileTriggers:
+    """
+    Things that happen when the player stands on a tile (teleports, bushes, NPCs...),
+    indexed by tile coordinates so a lookup is a single dict probe.
+    Each tile holds at most one trigger per kind; the first one added wins.
+    """
+    _tiles: dict[tuple[int, int], dict[str, object]]
+
+    def __init__(self):
+        self._tiles = {}
+
+    def add(self, kind: str, tile_x: int, tile_y: int, value: object) -> None:
+        self._tiles.setdefault((tile_x, tile_y), {}).setdefault(kind, value)
+
+    def add_rect(self, kind: str, rect: pg.Rect, value: object) -> None:
+        """Register `value` on every tile the pixel rect covers."""
+        for tx, ty in self._tiles_in(rect):
+            self.add(kind, tx, ty, value)
+
+    def at(self, kind: str, pos: Position) -> object | None:
+        """Trigger of the given kind on the tile containing pos (pixel coordinates)."""
+        triggers = self._tiles.get((pos.x // GameSettings.TILE_SIZE, pos.y // GameSettings.TILE_SIZE))
+        return triggers.get(kind) if triggers else None
+
+    def in_rect(self, kind: str, rect: pg.Rect) -> object | None:
+        """First trigger of the given kind on any tile the pixel rect overlaps."""
+        for tile in self._tiles_in(rect):
+            triggers = self._tiles.get(tile)
+            if triggers and kind in triggers:
+                return triggers[kind]
+        return None
+
+    @staticmethod
+    def _tiles_in(rect: pg.Rect):
+        ts = GameSettings.TILE_SIZE
+        for ty in range(rect.top // ts, (rect.bottom - 1) // ts + 1):
+            for tx in range(rect.left // ts, (rect.right - 1) // ts + 1):
+                yield tx, ty
@@ -1,23 +1,25 @@
 # src/scenes/backpack_overlay.py
-import os
 import pygame as pg
 import json
 from functools import partial  # 用於綁定按鈕點擊事件的參數
 
 from src.utils import Logger, GameSettings
-from src.sprites import Sprite
+from src.utils.loader import ASSETS_DIR
+from src.core.services import resource_manager, input_manager
+from src.core.managers import HitGrid
 # 確保這裡的 import 路徑對應到你提供的 Button 檔案位置
 from src.interface.components.button import Button 
+from src.interface.components.widget import Label, Icon, Panel
 
 # -------------------
 # load_image 函式
 # -------------------
 def load_image(path: str) -> pg.Surface:
-    """載入圖片並轉換 alpha，找不到檔案回傳透明表面"""
-    if not os.path.isfile(path):
+    """經由 resource_manager 載入 assets/images 下的圖片，找不到檔案回傳透明表面"""
+    if not (ASSETS_DIR / "images" / path).is_file():
         Logger.warning(f"Image not found: {path}")
         return pg.Surface((50, 50), pg.SRCALPHA)
-    return pg.image.load(path).convert_alpha()
+    return resource_manager.get_image(path)
 
 
 class BackpackOverlay:
@@ -32,9 +34,9 @@ class BackpackOverlay:
         self.y = (GameSettings.SCREEN_HEIGHT - self.height) // 2
 
         # 字體
-        self.font_title = pg.font.SysFont("arial", 28, bold=True)
-        self.font_item = pg.font.SysFont("arial", 22)
-        self.font_info = pg.font.SysFont("arial", 18)
+        self.font_title = resource_manager.get_sys_font("arial", 28, bold=True)
+        self.font_item = resource_manager.get_sys_font("arial", 22)
+        self.font_info = resource_manager.get_sys_font("arial", 18)
 
         # 關閉按鈕
         btn_w, btn_h = 100, 50
@@ -56,6 +58,11 @@ class BackpackOverlay:
         # [新增] 儲存道具按鈕的列表
         # 結構: list of tuple (Button_Instance, Item_Data_Dict)
         self.item_buttons = [] 
+        self.hit_grid = HitGrid([(self.close_button, self.close_button.hitbox)])
+
+        # 面板外框與標題只畫一次，怪物列、道具名稱與數量各自只在內容變了才重畫
+        self.panel = Panel("backpack_overlay", (self.x, self.y, self.width, self.height), self.draw_background)
+        self.build_content()
 
     def close_overlay(self):
         self.game_scene.close_overlay()
@@ -143,6 +150,43 @@ class BackpackOverlay:
             # 將按鈕與資料存入列表，方便 Draw 的時候取用文字資料
             self.item_buttons.append((btn, item))
 
+        self.hit_grid.clear()
+        self.hit_grid.add(self.close_button, self.close_button.hitbox)
+        for btn, _ in self.item_buttons:
+            self.hit_grid.add(btn, btn.hitbox)
+
+        self.build_content()
+
+    def build_content(self):
+        """依目前的怪物與道具建立面板內容 (怪物列、道具名稱與數量)"""
+        content = []
+
+        grid_x = self.x + 20
+        grid_y = self.y + 100
+        cell_size = 60
+        spacing = 10
+
+        for idx, monster in enumerate(self.monsters):
+            row_y = grid_y + idx * (cell_size + spacing)
+            content += [
+                Icon(monster.get("sprite_path", ""), (cell_size, cell_size), (grid_x, row_y)),
+                Label(self.font_item, lambda m=monster: m["name"], (0, 0, 0), (grid_x + cell_size + 10, row_y + 5)),
+                Label(self.font_info, lambda m=monster: f"HP:{m['hp']}/{m['max_hp']} Lv:{m['level']}", (0, 0, 0),
+                      (grid_x + cell_size + 10, row_y + 30)),
+            ]
+
+        # 道具的名稱與數量畫在按鈕下方
+        for btn, item in self.item_buttons:
+            x, y = btn.hitbox.x, btn.hitbox.y
+            height = btn.hitbox.height
+            content += [
+                Label(self.font_item, lambda i=item: i["name"], (0, 0, 0), (x, y + height + 2)),
+                Label(self.font_info, lambda i=item: f"x{i['count']}", (0, 0, 0), (x, y + height + 22)),
+            ]
+
+        self.panel.children = content
+        self.content_monsters = len(self.monsters)
+
     def sync_with_game_manager(self):
         """同步 JSON 資料到背包 Overlay"""
         gm = getattr(self.game_scene, "game_manager", None)
@@ -156,86 +200,41 @@ class BackpackOverlay:
         # 簡單檢查資料是否有變動 (這裡用長度判斷，若要更嚴謹需比對內容)
         # 只有在資料變動時才重新生成按鈕，避免每一幀都 new Button 造成效能浪費與點擊失效
         data_changed = (len(current_items) != len(self.items)) or (self.items != current_items)
+        monsters_changed = current_monsters is not self.monsters or len(current_monsters) != self.content_monsters
 
         self.monsters = current_monsters
         self.items = current_items
 
         if data_changed:
             self.refresh_item_buttons()
+        elif monsters_changed:
+            self.build_content()
 
     def update(self, dt: float):
         self.sync_with_game_manager()
-        self.close_button.update(dt)
-        
-        # [新增] 更新所有道具按鈕
-        for btn, _ in self.item_buttons:
-            btn.update(dt)
+        # 關閉按鈕與所有道具按鈕
+        input_manager.dispatch(self.hit_grid)
+
+    def draw_background(self, layer: pg.Surface):
+        """ 面板上的標題與區塊標籤 (面板座標)，面板本身由 Panel 畫 """
+        layer.blit(self.font_title.render("Backpack", True, (0, 0, 0)), (20, 15))
+        layer.blit(self.font_title.render("Monsters:", True, (0, 0, 0)), (20, 60))
+        layer.blit(self.font_title.render("Items:", True, (0, 0, 0)), (320, 60))
 
     def draw(self, screen: pg.Surface):
         if not self.visible:
             return
 
         # -------------------
-        # 半透明背景
-        # -------------------
-        overlay_bg = pg.Surface(screen.get_size(), pg.SRCALPHA)
-        overlay_bg.fill((0, 0, 0, 180))
-        screen.blit(overlay_bg, (0, 0))
-
-        # -------------------
-        # 面板
-        # -------------------
-        panel_rect = pg.Rect(self.x, self.y, self.width, self.height)
-        pg.draw.rect(screen, (240, 240, 240), panel_rect, border_radius=12)
-        pg.draw.rect(screen, (0, 0, 0), panel_rect, 2, border_radius=12)
-
-        # 標題
-        title_text = self.font_title.render("Backpack", True, (0, 0, 0))
-        screen.blit(title_text, (self.x + 20, self.y + 15))
-
-        # -------------------
-        # 怪物區塊 (維持原樣)
+        # 半透明背景、面板、標題、怪物列、道具名稱與數量 (都是預先畫好的)
         # -------------------
-        monster_label = self.font_title.render("Monsters:", True, (0, 0, 0))
-        screen.blit(monster_label, (self.x + 20, self.y + 60))
-
-        grid_x = self.x + 20
-        grid_y = self.y + 100
-        cell_size = 60
-        spacing = 10
-
-        for idx, monster in enumerate(self.monsters):
-            sprite_path = monster.get("sprite_path", "")
-            # 這裡如果也要改成按鈕，邏輯同下方道具區塊
-            monster_img = Sprite(sprite_path, (cell_size, cell_size))
-            screen.blit(monster_img.image, (grid_x, grid_y + idx * (cell_size + spacing)))
-
-            name_text = self.font_item.render(monster["name"], True, (0, 0, 0))
-            hp_text = self.font_info.render(f"HP:{monster['hp']}/{monster['max_hp']} Lv:{monster['level']}", True, (0, 0, 0))
-            screen.blit(name_text, (grid_x + cell_size + 10, grid_y + idx * (cell_size + spacing) + 5))
-            screen.blit(hp_text, (grid_x + cell_size + 10, grid_y + idx * (cell_size + spacing) + 30))
+        self.panel.draw(screen)
 
         # -------------------
-        # 道具區塊 (已修改為 Button)
+        # 道具按鈕 (處理了 hover 和點擊判定)
         # -------------------
-        item_label = self.font_title.render("Items:", True, (0, 0, 0))
-        screen.blit(item_label, (self.x + 320, self.y + 60))
-
-        # [修改] 迭代按鈕列表進行繪製
-        for btn, item in self.item_buttons:
-            # 1. 繪製按鈕 (處理了 hover 和點擊判定)
+        for btn, _ in self.item_buttons:
             btn.draw(screen)
-            
-            # 2. 根據按鈕的位置繪製文字 (Name, Count)
-            # btn.hitbox 屬性包含了按鈕的 x, y, width, height
-            x, y = btn.hitbox.x, btn.hitbox.y
-            width, height = btn.hitbox.width, btn.hitbox.height
-
-            name_text = self.font_item.render(item["name"], True, (0, 0, 0))
-            count_text = self.font_info.render(f"x{item['count']}", True, (0, 0, 0))
-            
-            screen.blit(name_text, (x, y + height + 2))
-            screen.blit(count_text, (x, y + height + 22))
 
         # -------------------
         # 關閉按鈕
@@ -4,8 +4,8 @@ import random
 from src.core import GameManager 
 from src.scenes.backpack_overlay import BackpackOverlay
 from src.scenes.setting_overlay import SettingOverlay
-from src.core.services import scene_manager, input_manager
-from src.utils import load_img
+from src.core.services import scene_manager, input_manager, resource_manager
+from src.core.managers import AssetManifest, PointerTarget, HitGrid
 
 # =========================
 # [特效 1] 飄浮傷害數字類別
@@ -16,25 +16,26 @@ class DamageText:
         self.y = y
         self.text = str(damage)
         self.color = color
-        self.font = pg.font.SysFont("Arial", 30, bold=True)
-        self.life = 60  # 存在 60幀
+        self.font = resource_manager.get_sys_font("Arial", 30, bold=True)
+        self.life = 1.0  # 存在 1 秒
         self.offset_y = 0
         self.alpha = 255
+        # 文字不會變，只 render 一次；淡出用 set_alpha，所以不用共用快取的 surface
+        self.surf = self.font.render(self.text, True, self.color)
+        self.outline = self.font.render(self.text, True, (0,0,0))
 
-    def update(self):
-        self.life -= 1
-        self.offset_y -= 1.5
-        if self.life < 20:
-            self.alpha = int((self.life / 20) * 255)
+    def update(self, dt):
+        self.life -= dt
+        self.offset_y -= 90 * dt
+        if self.life < 1 / 3:
+            self.alpha = max(0, int((self.life * 3) * 255))
 
     def draw(self, screen):
         if self.life > 0:
-            surf = self.font.render(self.text, True, self.color)
-            surf.set_alpha(self.alpha)
-            outline = self.font.render(self.text, True, (0,0,0))
-            outline.set_alpha(self.alpha)
-            screen.blit(outline, (self.x + 2, self.y + self.offset_y + 2))
-            screen.blit(surf, (self.x, self.y + self.offset_y))
+            self.surf.set_alpha(self.alpha)
+            self.outline.set_alpha(self.alpha)
+            screen.blit(self.outline, (self.x + 2, self.y + self.offset_y + 2))
+            screen.blit(self.surf, (self.x, self.y + self.offset_y))
 
 # =========================
 # [特效 4] 投射物 (子彈/火球) 類別
@@ -45,7 +46,7 @@ class Projectile:
         self.target = pg.Vector2(end_pos)
         self.color = color
         self.on_hit_callback = on_hit_callback
-        self.speed = 25
+        self.speed = 1500  # px / 秒
         self.arrived = False
 
         direction = self.target - self.pos
@@ -54,15 +55,15 @@ class Projectile:
         else:
             self.velocity = pg.Vector2(0, 0)
 
-    def update(self):
+    def update(self, dt):
         remaining_distance = self.pos.distance_to(self.target)
-        if remaining_distance < self.speed:
+        if remaining_distance < self.speed * dt:
             self.pos = self.target
             self.arrived = True
             if self.on_hit_callback:
                 self.on_hit_callback()
         else:
-            self.pos += self.velocity
+            self.pos += self.velocity * dt
 
     def draw(self, screen):
         pg.draw.circle(screen, self.color, (int(self.pos.x), int(self.pos.y)), 15)
@@ -71,38 +72,26 @@ class Projectile:
 # =========================
 # 按鈕類別
 # =========================
-class Button:
+class Button(PointerTarget):
     def __init__(self, rect, text, callback):
         self.rect = pg.Rect(rect)
         self.text = text
         self.callback = callback
-        self.font = pg.font.SysFont(None, 28)
+        self.font = resource_manager.get_sys_font(None, 28)
         self.offset_y = 0
-        self.prev_pressed = False
-    
-    def update(self, enabled=True):
-        mouse_pos = pg.mouse.get_pos()
-        mouse_down = pg.mouse.get_pressed()[0]
-
-        if not enabled: return
-
-        hover = self.rect.collidepoint(mouse_pos)
-        self.offset_y = 5 if hover else 0
-
-        if hover and mouse_down and not self.prev_pressed:
-            self.callback()
 
-        self.prev_pressed = mouse_down
+    def on_hover(self, hovered):
+        self.offset_y = 5 if hovered else 0
 
-    def reset_press(self):
-        self.prev_pressed = False
+    def on_press(self, pos):
+        self.callback()
 
     def draw(self, screen):
         draw_rect = self.rect.copy()
         draw_rect.y += self.offset_y
         pg.draw.rect(screen, (255, 255, 255), draw_rect)
         pg.draw.rect(screen, (0, 0, 0), draw_rect, 2)
-        text_surf = self.font.render(self.text, True, (0, 0, 0))
+        text_surf = resource_manager.render_text(self.font, self.text, (0, 0, 0))
         text_rect = text_surf.get_rect(center=draw_rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -123,16 +112,18 @@ class Monster:
             self.element = data["element"]
         else:
             self.element = random.choice(["Water", "Fire", "Grass"])
-        self.sprite = load_img(data["sprite_path"])
+        self.sprite = resource_manager.get_image(data["sprite_path"])
         self.sprite = pg.transform.scale(self.sprite, (100, 100))
 
 # =========================
 # BattleScene
 # =========================
 class BattleScene:
+    ASSETS = AssetManifest(images=["backgrounds/background2.png"])
+
     def __init__(self):
         self.screen_size = pg.display.get_surface().get_size()
-        self.background = load_img("backgrounds/background2.png")
+        self.background = resource_manager.get_image("backgrounds/background2.png")
         self.background = pg.transform.scale(self.background, self.screen_size)
         self.battle_over = False
         self.game_manager = None
@@ -172,9 +163,12 @@ class BattleScene:
             "Bag", self.open_backpack
         )
 
-        self.font = pg.font.SysFont(None, 24)
+        self.hit_grid = HitGrid([(btn, btn.rect) for btn in self.buttons + [self.btn_setting, self.btn_backpack]])
+
+        self.font = resource_manager.get_sys_font(None, 24)
         self.turn = "player"
-        self.enemy_next_action_time = 0
+        self.enemy_think_timer = None   # 秒，敵人回合開始前為 None
+        self.evo_cooldown = 0.0         # 秒，E 鍵連按的間隔
 
     def open_setting(self):
         self.overlay_type = "setting"
@@ -250,17 +244,15 @@ class BattleScene:
         self.damage_texts = [] 
         self.projectiles = []
         
-        for btn in self.buttons: btn.reset_press()
-        self.btn_setting.reset_press()
-        self.btn_backpack.reset_press()
+        self.hit_grid.refresh()
         self.battle_over = False
         self.overlay_type = None
         
         self.has_evolved = False      
         self.evo_press_count = 0      
-        self.last_press_time = 0      
+        self.evo_cooldown = 0.0
 
-        self.enemy_next_action_time = 0 
+        self.enemy_think_timer = None
 
         print(f"★ 戰鬥開始 -> P: {self.player_monster.hp}, E: {self.enemy_monster.hp}")
 
@@ -303,12 +295,12 @@ class BattleScene:
                 if final_damage < 1: final_damage = 1
                 defender.hp -= final_damage
                 
-                self.shake_timer = 10
-                defender.hit_flash_timer = 10
+                self.shake_timer = 1 / 6  # 秒
+                defender.hit_flash_timer = 1 / 6
                 self.damage_texts.append(DamageText(dmg_x, dmg_y, final_damage, txt_color))
 
                 self.turn = "enemy" if self.turn == "player" else "player"
-                self.enemy_next_action_time = 0
+                self.enemy_think_timer = None
 
             if self.turn == "player":
                 on_hit = lambda: apply_damage(self.player_monster, self.enemy_monster, True)
@@ -330,7 +322,7 @@ class BattleScene:
             else:
                 self.enemy_monster.hp = min(self.enemy_monster.hp + 10, self.enemy_monster.max_hp)
             self.turn = "enemy" if self.turn == "player" else "player"
-            self.enemy_next_action_time = 0
+            self.enemy_think_timer = None
 
         elif text == "Switch":
             pass 
@@ -370,7 +362,7 @@ class BattleScene:
             return 
         elif getattr(self, "overlay_type", None) == "setting":
             self.setting_overlay.update(dt)
-            if pg.key.get_pressed()[pg.K_ESCAPE]: self.close_overlay()
+            if input_manager.key_down(pg.K_ESCAPE): self.close_overlay()
             return
 
         if self.player_monster.hp <= 0 or self.enemy_monster.hp <= 0:
@@ -379,52 +371,50 @@ class BattleScene:
         if not self.battle_over:
             is_player_turn = (self.turn == "player" and len(self.projectiles) == 0)
             for btn in self.buttons: 
-                if btn.text in ["Run", "Switch"]: btn.update(enabled=True)
-                else: btn.update(enabled=is_player_turn)
-            self.btn_setting.update(enabled=True)
-            self.btn_backpack.update(enabled=True)
+                if btn.text not in ["Run", "Switch"]: self.hit_grid.set_enabled(btn, is_player_turn)
+            input_manager.dispatch(self.hit_grid)
 
             if self.turn == "enemy" and len(self.projectiles) == 0:
-                current_time = pg.time.get_ticks()
-                if self.enemy_next_action_time == 0:
-                    self.enemy_next_action_time = current_time + 1000
+                # 用 dt 倒數，跟著固定的邏輯步長走，不看牆上時間
+                if self.enemy_think_timer is None:
+                    self.enemy_think_timer = 1.0  # 秒
                     print("【系統】敵人正在思考中...")
+                else:
+                    self.enemy_think_timer -= dt
 
-                if current_time >= self.enemy_next_action_time:
+                if self.enemy_think_timer <= 0:
                     print("【系統】敵人發動攻擊！")
                     self.handle_action("Fight")
-                    self.enemy_next_action_time = 0 
+                    self.enemy_think_timer = None
             else:
-                self.enemy_next_action_time = 0
-
-        keys = pg.key.get_pressed()
-        if keys[pg.K_e]:
-            current_time = pg.time.get_ticks()
-            if not hasattr(self, "last_press_time"): self.last_press_time = 0
-            if current_time - self.last_press_time > 500:
-                if not getattr(self, "has_evolved", False):
-                    self.evo_press_count += 1
-                    self.last_press_time = current_time 
-                    if self.evo_press_count >= 2: self.perform_evolution()
+                self.enemy_think_timer = None
+
+        if self.evo_cooldown > 0:
+            self.evo_cooldown -= dt
+        if input_manager.key_down(pg.K_e) and self.evo_cooldown <= 0:
+            if not getattr(self, "has_evolved", False):
+                self.evo_press_count += 1
+                self.evo_cooldown = 0.5  # 秒
+                if self.evo_press_count >= 2: self.perform_evolution()
 
         for proj in self.projectiles:
-            proj.update()
+            proj.update(dt)
         self.projectiles = [p for p in self.projectiles if not p.arrived]
 
         if self.shake_timer > 0:
-            self.shake_timer -= 1
+            self.shake_timer -= dt
             magnitude = 5
             self.shake_offset = [random.randint(-magnitude, magnitude), random.randint(-magnitude, magnitude)]
         else:
             self.shake_offset = [0, 0]
 
-        for dt_txt in self.damage_texts: dt_txt.update()
+        for dt_txt in self.damage_texts: dt_txt.update(dt)
         self.damage_texts = [t for t in self.damage_texts if t.life > 0] 
 
-        if self.player_monster.hit_flash_timer > 0: self.player_monster.hit_flash_timer -= 1
-        if self.enemy_monster.hit_flash_timer > 0: self.enemy_monster.hit_flash_timer -= 1
+        if self.player_monster.hit_flash_timer > 0: self.player_monster.hit_flash_timer -= dt
+        if self.enemy_monster.hit_flash_timer > 0: self.enemy_monster.hit_flash_timer -= dt
 
-        if keys[pg.K_RETURN]:
+        if input_manager.key_down(pg.K_RETURN):
             try:
                 from src.core.managers.scene_manager import scene_manager
                 scene_manager.change_scene("game")
@@ -443,14 +433,14 @@ class BattleScene:
         pg.draw.rect(screen, (0, 0, 0), (x, y, w, h), 2)
 
     def draw_monster_info(self, screen, monster, x, y):
-        name_text = self.font.render(monster.name, True, (0,0,0))
+        name_text = resource_manager.render_text(self.font, monster.name, (0,0,0))
         screen.blit(name_text, (x, y))
         color_map = {"Water": (0, 0, 255), "Fire": (255, 0, 0), "Grass": (0, 150, 0)}
-        elem_text = self.font.render(monster.element, True, color_map.get(monster.element, (0, 0, 0)))
+        elem_text = resource_manager.render_text(self.font, monster.element, color_map.get(monster.element, (0, 0, 0)))
         screen.blit(elem_text, (x + 100, y + 50))
         #atk_text = self.font.render(f"ATK: {monster.attack}", True, (100, 0, 0))
         #screen.blit(atk_text, (x + 100, y + 70))
-        hp_text = self.font.render(f"{monster.hp}/{monster.max_hp} HP", True, (0,0,0))
+        hp_text = resource_manager.render_text(self.font, f"{monster.hp}/{monster.max_hp} HP", (0,0,0))
         screen.blit(hp_text, (x, y + 45))
 
     def draw_monster_sprite(self, screen, monster, x, y):
@@ -484,11 +474,9 @@ class BattleScene:
         self.btn_backpack.draw(screen)
 
         txt = f"What will {self.player_monster.name if self.turn == 'player' else self.enemy_monster.name} do?"
-        screen.blit(self.font.render(txt, True, (0, 0, 0)), (50, self.screen_size[1]-100))
+        screen.blit(resource_manager.render_text(self.font, txt, (0, 0, 0)), (50, self.screen_size[1]-100))
 
         if self.overlay_type == "backpack": self.backpack_overlay.draw(screen)
         elif self.overlay_type == "setting":
-            overlay = pg.Surface(screen.get_size(), pg.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            screen.blit(overlay, (0, 0))
+            screen.blit(resource_manager.get_dim_layer(screen.get_size(), (0, 0, 0, 180)), (0, 0))
             self.setting_overlay.draw(screen)
\ No newline at end of file
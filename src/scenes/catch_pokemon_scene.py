@@ -1,37 +1,33 @@
 import pygame as pg
 import json
 import random
-from src.core.services import scene_manager, input_manager
-from src.utils import load_img
+from src.core.services import scene_manager, input_manager, resource_manager
+from src.core.managers import AssetManifest, PointerTarget, HitGrid
 from src.scenes.scene import Scene
 
-class Button:
+class Button(PointerTarget):
     """按鈕，滑鼠經過時會下壓"""
     def __init__(self, rect, text, callback):
         self.rect = pg.Rect(rect)
         self.text = text
         self.callback = callback
-        self.font = pg.font.SysFont(None, 28)
+        self.font = resource_manager.get_sys_font(None, 28)
         self.offset_y = 0  # 下壓偏移
 
-    def update(self):
-        mouse_pos = pg.mouse.get_pos()
+    def on_hover(self, hovered):
         # 滑鼠經過按鈕就下壓
-        if self.rect.collidepoint(mouse_pos):
-            self.offset_y = 5
-        else:
-            self.offset_y = 0
+        self.offset_y = 5 if hovered else 0
 
+    def on_press(self, pos):
         # 點擊事件
-        if self.rect.collidepoint(mouse_pos) and pg.mouse.get_pressed()[0]:
-            self.callback()
+        self.callback()
 
     def draw(self, screen):
         draw_rect = self.rect.copy()
         draw_rect.y += self.offset_y
         pg.draw.rect(screen, (255, 255, 255), draw_rect)
         pg.draw.rect(screen, (0, 0, 0), draw_rect, 2)
-        text_surf = self.font.render(self.text, True, (0, 0, 0))
+        text_surf = resource_manager.render_text(self.font, self.text, (0, 0, 0))
         text_rect = text_surf.get_rect(center=draw_rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -48,16 +44,18 @@ class Monster:
             self.element = data["element"]
         else:
             self.element = random.choice(["Water", "Fire", "Grass"])
-        self.sprite = load_img(data["sprite_path"])
+        self.sprite = resource_manager.get_image(data["sprite_path"])
         self.sprite = pg.transform.scale(self.sprite, (100, 100))
 
 
 class CatchPokemonScene(Scene):
     """抓寶可夢戰鬥場景"""
+    ASSETS = AssetManifest(images=["backgrounds/background3.png"])
+
     def __init__(self):
         super().__init__()
         self.screen_size = pg.display.get_surface().get_size()
-        self.background = load_img("backgrounds/background3.png")
+        self.background = resource_manager.get_image("backgrounds/background3.png")
         self.background = pg.transform.scale(self.background, self.screen_size)
 
         # 新增：要加入背包的怪物
@@ -82,8 +80,9 @@ class CatchPokemonScene(Scene):
             Button((start_x + i*(btn_w+margin), y_pos, btn_w, btn_h), text, getattr(self, f"{text.lower()}_action"))
             for i, text in enumerate(["Fight", "Item", "Switch", "Run"])
         ]
+        self.hit_grid = HitGrid([(btn, btn.rect) for btn in self.buttons])
 
-        self.font = pg.font.SysFont(None, 24)
+        self.font = resource_manager.get_sys_font(None, 24)
 
     # -----------------------
     # 生命週期
@@ -162,13 +161,10 @@ class CatchPokemonScene(Scene):
     # 更新
     # -----------------------
     def update(self, dt):
-        for btn in self.buttons:
-            btn.update()
-
-        keys = pg.key.get_pressed()
+        input_manager.dispatch(self.hit_grid)
 
         # ENTER → 結束戰鬥
-        if keys[pg.K_RETURN]:
+        if input_manager.key_down(pg.K_RETURN):
 
             # 如果敵人死亡 → 把怪物加入背包 + 寫回 JSON
             if self.enemy_monster.hp <= 0 and self.caught_monster is not None:
@@ -202,19 +198,19 @@ class CatchPokemonScene(Scene):
     # -----------------------
     def draw_monster_info(self, screen, monster, x, y):
         # 名字
-        name_text = self.font.render(monster.name, True, (0,0,0))
+        name_text = resource_manager.render_text(self.font, monster.name, (0,0,0))
         screen.blit(name_text, (x, y))
 
         # [新增 4] 繪製屬性文字 (用不同顏色區分)
         color_map = {"Water": (0, 0, 255), "Fire": (255, 0, 0), "Grass": (0, 150, 0)}
         elem_color = color_map.get(monster.element, (0, 0, 0))
         
-        elem_text = self.font.render(monster.element, True, elem_color)
+        elem_text = resource_manager.render_text(self.font, monster.element, elem_color)
         screen.blit(elem_text, (x + 80, y)) # 畫在名字右邊
 
         # 等級和 HP
-        lvl_text = self.font.render(f"Lv {monster.level}", True, (0,0,0))
-        hp_text = self.font.render(f"{monster.hp}/{monster.max_hp} HP", True, (0,0,0))
+        lvl_text = resource_manager.render_text(self.font, f"Lv {monster.level}", (0,0,0))
+        hp_text = resource_manager.render_text(self.font, f"{monster.hp}/{monster.max_hp} HP", (0,0,0))
         screen.blit(lvl_text, (x - 45, y + 25))
         screen.blit(hp_text, (x, y + 45))
 
@@ -243,5 +239,5 @@ class CatchPokemonScene(Scene):
             btn.draw(screen)
 
         # 提示文字
-        info_text = self.font.render(f"What will {self.player_monster.name} do?", True, (0, 0, 0))
+        info_text = resource_manager.render_text(self.font, f"What will {self.player_monster.name} do?", (0, 0, 0))
         screen.blit(info_text, (50, self.screen_size[1]-100))
@@ -3,8 +3,9 @@ from typing import override
 
 from src.scenes.scene import Scene
 from src.core import GameManager, OnlineManager
-from src.utils import Logger, PositionCamera, GameSettings, Position
-from src.core.services import sound_manager, scene_manager, input_manager
+from src.utils import Logger, PositionCamera, GameSettings, Position, profiler
+from src.core.services import sound_manager, scene_manager, input_manager, resource_manager
+from src.core.managers import AssetManifest, HitGrid
 from src.sprites import Sprite
 from src.interface.components.button import Button
 
@@ -19,9 +20,24 @@ from src.scenes.navigation_overlay import NavigationOverlay
 from src.scenes.battle_scene import BattleScene
 from src.scenes.catch_pokemon_scene import CatchPokemonScene
 from src.entities.shop_npc import ShopNPC
+from src.maps import TileTriggers
 
 
 class GameScene(Scene):
+    ASSETS = AssetManifest(
+        images=[
+            "character/ow1.png", "exclamation.png", "menu_sprites/menusprite1.png",
+            "ingame_ui/options1.png", "ingame_ui/potion.png", "ingame_ui/ball.png",
+            "UI/button_x.png", "UI/button_x_hover.png",
+            "UI/button_save.png", "UI/button_save_hover.png",
+            "UI/button_load.png", "UI/button_load_hover.png",
+            "UI/button_back.png", "UI/button_back_hover.png",
+            "UI/button_shop.png", "UI/button_shop_hover.png",
+            "UI/button_setting.png", "UI/button_setting_hover.png",
+            "UI/button_backpack.png", "UI/button_backpack_hover.png",
+        ],
+        music=["RBY 103 Pallet Town.ogg"],
+    )
     game_manager: GameManager
     online_manager: OnlineManager | None
     sprite_online: Sprite
@@ -45,11 +61,12 @@ class GameScene(Scene):
         player_y = player.position.y
 
         # ---------------------------
-        # Bushes for catching Pokemon
+        # Tile triggers (bushes, NPC interaction)
         # ---------------------------
-        self.bushes = [
-            pg.Rect(player_x - 8 * TS, player_y + 1* TS, TS, TS)
-        ]
+        self.triggers = TileTriggers()
+
+        # Bushes for catching Pokemon
+        self.triggers.add_rect("bush", pg.Rect(player_x - 8 * TS, player_y + 1* TS, TS, TS), True)
 
         # ---------------------------
         # Shop NPC
@@ -57,6 +74,8 @@ class GameScene(Scene):
         self.shop_npcs = [
             ShopNPC(18, 30, "menu_sprites/menusprite1.png")
         ]
+        for npc in self.shop_npcs:
+            self.triggers.add_rect("shop", npc.rect, npc)
 
         # ---------------------------
         # Overlays Initialization
@@ -115,6 +134,11 @@ class GameScene(Scene):
             self.close_overlay
         )
 
+        # 沒開介面時的按鈕，與 setting 介面下的返回按鈕
+        self.hud_grid = HitGrid([(btn, btn.hitbox) for btn in (self.setting_button, self.backpack_button, self.nav_button)])
+        self.minimap.add_to(self.hud_grid)  # 滾輪縮放、拖曳平移
+        self.back_grid = HitGrid([(self.back_button, self.back_button.hitbox)])
+
         # 玩家與 NPC 互動範圍
         self.interaction_range = 300
 
@@ -135,10 +159,10 @@ class GameScene(Scene):
         self.shop_warnings = [] 
 
         # Warning Images
-        font = pg.font.SysFont(None, 36)
+        font = resource_manager.get_sys_font(None, 36)
         self.warning_img = font.render("!", True, (255, 0, 0))
         
-        font_shop = pg.font.SysFont(None, 20)
+        font_shop = resource_manager.get_sys_font(None, 20)
         self.shop_label_img = font_shop.render("SHOP", True, (100, 100, 255))
 
     # ==============================
@@ -197,11 +221,10 @@ class GameScene(Scene):
             )       
 
             # ShopNPC
-            for npc in self.shop_npcs:
-                if player_rect.colliderect(npc.rect):
-                    self.overlay_type = "shop"
-                    self.shop_overlay.visible = True
-                    return
+            if self.triggers.in_rect("shop", player_rect):
+                self.overlay_type = "shop"
+                self.shop_overlay.visible = True
+                return
 
             # Enemy
             if self.closest_enemy:
@@ -209,33 +232,31 @@ class GameScene(Scene):
                 return
 
             # Bushes
-            for bush in self.bushes:
-                if player_rect.colliderect(bush):
-                    scene_manager.change_scene("catch_pokemon")
-                    return
+            if self.triggers.in_rect("bush", player_rect):
+                scene_manager.change_scene("catch_pokemon")
+                return
 
         # ---------------------------
         # UI & Overlay Update
         # ---------------------------
         if self.overlay_type is None:
             # [修正] 沒開介面時，更新所有按鈕
-            self.setting_button.update(dt)
-            self.backpack_button.update(dt)
-            self.nav_button.update(dt) # [修正] 變數名稱與拼字
+            input_manager.dispatch(self.hud_grid)
         else:
-            # 依據類型更新對應介面
-            if self.overlay_type == "backpack":
-                self.backpack_overlay.update(dt)
-            elif self.overlay_type == "setting":
-                self.setting_overlay.update(dt)
-            elif self.overlay_type == "shop":
-                self.shop_overlay.update(dt)
-            elif self.overlay_type == "NAVIGATION": # [修正] 統一用 NAVIGATION
-                self.nav_overlay.update(dt)
-            
-            # 通用返回按鈕 (如果該介面沒有自己的關閉按鈕)
-            if self.overlay_type == "setting": 
-                self.back_button.update(dt)
+            with profiler.section("update.overlays"):
+                # 依據類型更新對應介面
+                if self.overlay_type == "backpack":
+                    self.backpack_overlay.update(dt)
+                elif self.overlay_type == "setting":
+                    self.setting_overlay.update(dt)
+                elif self.overlay_type == "shop":
+                    self.shop_overlay.update(dt)
+                elif self.overlay_type == "NAVIGATION": # [修正] 統一用 NAVIGATION
+                    self.nav_overlay.update(dt)
+                
+                # 通用返回按鈕 (如果該介面沒有自己的關閉按鈕)
+                if self.overlay_type == "setting": 
+                    input_manager.dispatch(self.back_grid)
             
 
         # ---------------------------
@@ -287,10 +308,16 @@ class GameScene(Scene):
         # Game logic (Map, Player, Net)
         # ---------------------------
         self.game_manager.try_switch_map()
-        if self.game_manager.player:
-            self.game_manager.player.update(dt)
-        for enemy in self.game_manager.current_enemy_trainers:
-            enemy.update(dt)
+        self.game_manager.prefetch_maps()
+        with profiler.section("update.entities"):
+            if self.game_manager.player:
+                self.game_manager.player.begin_step()
+            for enemy in self.game_manager.current_enemy_trainers:
+                enemy.begin_step()
+            if self.game_manager.player:
+                self.game_manager.player.update(dt)
+            for enemy in self.game_manager.current_enemy_trainers:
+                enemy.update(dt)
         self.game_manager.bag.update(dt)
 
         if self.game_manager.player and self.online_manager:
@@ -308,20 +335,24 @@ class GameScene(Scene):
         # 1. Draw Map & Entities
         if self.game_manager.player:
             screen_width, screen_height = screen.get_size()
-            px = self.game_manager.player.position.x
-            py = self.game_manager.player.position.y
+            # Follow the interpolated position so the camera moves as smoothly as the player
+            render_pos = self.game_manager.player.render_position
+            px, py = render_pos.x, render_pos.y
             camera = PositionCamera(px - screen_width // 2, py - screen_height // 2)
             self.game_manager.current_map.draw(screen, camera)
-            self.game_manager.player.draw(screen, camera)
         else:
             camera = PositionCamera(0, 0)
             self.game_manager.current_map.draw(screen, camera)
 
-        for enemy in self.game_manager.current_enemy_trainers:
-            enemy.draw(screen, camera)
+        with profiler.section("draw.entities"):
+            if self.game_manager.player:
+                self.game_manager.player.draw(screen, camera)
 
-        for npc in self.shop_npcs:
-            npc.draw(screen, camera)
+            for enemy in self.game_manager.current_enemy_trainers:
+                enemy.draw(screen, camera)
+
+            for npc in self.shop_npcs:
+                npc.draw(screen, camera)
 
         # 2. Draw Online Players
         if self.online_manager and self.game_manager.player:
@@ -331,6 +362,9 @@ class GameScene(Scene):
                     self.sprite_online.update_pos(pos)
                     self.sprite_online.draw(screen)
 
+        # Map layers that sit above the entities (roofs, tree tops, ...)
+        self.game_manager.current_map.draw_overlay(screen, camera)
+
         # 3. Draw Warnings
         for rect in self.enemy_warnings:
             screen.blit(self.warning_img, (rect.centerx - 10 - camera.x, rect.y - 40 - camera.y))
@@ -340,7 +374,8 @@ class GameScene(Scene):
         # 4. Draw UI Elements (Minimap & Buttons)
         # 只有在沒有 Overlay 時才畫這些
         if self.overlay_type is None:
-            self.minimap.draw(screen)
+            with profiler.section("draw.minimap"):
+                self.minimap.draw(screen)
             
             # [修正] 畫出三個按鈕 (原本漏掉 nav_button)
             # 使用 button 類別內建的 draw (如果你 button 類別有 draw 方法)
@@ -356,27 +391,26 @@ class GameScene(Scene):
         # 5. Draw Overlays
         # [修正] 清理了底部重複的程式碼，結構更清晰
         
-        # 情況 A: 全螢幕覆蓋型 (自帶背景)
-        if self.overlay_type == "shop":
-            self.shop_overlay.draw(screen)
-        
-        elif self.overlay_type == "backpack":
-            self.backpack_overlay.draw(screen)
-            
-        elif self.overlay_type == "NAVIGATION":
-            self.nav_overlay.draw(screen)
-
-        # 情況 B: 通用視窗型 (Setting) - 這裡才畫通用背景
-        elif self.overlay_type == "setting":
-            # 半透明黑底
-            overlay = pg.Surface(screen.get_size(), pg.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            screen.blit(overlay, (0, 0))
+        with profiler.section("draw.overlays"):
+            # 情況 A: 全螢幕覆蓋型 (自帶背景)
+            if self.overlay_type == "shop":
+                self.shop_overlay.draw(screen)
             
-            # Setting 內容
-            self.setting_overlay.draw(screen)
-            # 通用返回按鈕
-            screen.blit(self.back_button.img_button.image, self.back_button.hitbox)
+            elif self.overlay_type == "backpack":
+                self.backpack_overlay.draw(screen)
+                
+            elif self.overlay_type == "NAVIGATION":
+                self.nav_overlay.draw(screen)
+
+            # 情況 B: 通用視窗型 (Setting) - 這裡才畫通用背景
+            elif self.overlay_type == "setting":
+                # 半透明黑底
+                screen.blit(resource_manager.get_dim_layer(screen.get_size(), (0, 0, 0, 180)), (0, 0))
+                
+                # Setting 內容
+                self.setting_overlay.draw(screen)
+                # 通用返回按鈕
+                screen.blit(self.back_button.img_button.image, self.back_button.hitbox)
 
     # ------------------------------------------------
     # [新增] 這是 NavigationOverlay 專門呼叫的關閉函式
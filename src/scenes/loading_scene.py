@@ -0,0 +1,61 @@
+import time
+import pygame as pg
+from typing import override
+
+from src.scenes.scene import Scene
+from src.utils import GameSettings, Logger
+from src.core.services import scene_manager, asset_loader, resource_manager
+from src.core.managers import AssetManifest
+
+class LoadingScene(Scene):
+    """
+    Shown while the assets of `next_scene` are decoded in the background, then
+    switches to it. Other scenes are built lazily by the SceneManager when they
+    are first entered.
+    """
+    _next_scene: str
+    _required: AssetManifest
+    _start: float
+    _done: bool
+
+    def __init__(self, next_scene: str):
+        super().__init__()
+        self._next_scene = next_scene
+        self._required = AssetManifest()
+        self._start = time.perf_counter()
+        self._done = False
+        self.font = resource_manager.get_sys_font(None, 36)
+
+    @override
+    def enter(self) -> None:
+        self._start = time.perf_counter()
+        manifest = scene_manager.manifest(self._next_scene) or AssetManifest()
+        # Streamed music is read while it plays, decoded music has to be ready first
+        music = [] if GameSettings.STREAM_BGM else manifest.music
+        self._required = AssetManifest(manifest.images, manifest.sounds + music)
+        asset_loader.load(self._required)
+
+    @override
+    def update(self, dt: float) -> None:
+        if self._done or asset_loader.pending(self._required):
+            return
+        self._done = True
+        Logger.info(f"Loading finished after {(time.perf_counter() - self._start) * 1000:.0f} ms")
+        scene_manager.change_scene(self._next_scene)
+
+    @property
+    def progress(self) -> float:
+        required = len(self._required.images) + len(self._required.sounds)
+        if required == 0:
+            return 1.0
+        return (required - asset_loader.pending(self._required)) / required
+
+    @override
+    def draw(self, screen: pg.Surface) -> None:
+        screen.fill((20, 20, 30))
+        w, h = GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT
+        bar = pg.Rect(w // 4, h // 2, w // 2, 24)
+        pg.draw.rect(screen, (80, 80, 100), bar, 2)
+        pg.draw.rect(screen, (120, 200, 120), (bar.x + 4, bar.y + 4, int((bar.width - 8) * self.progress), bar.height - 8))
+        text = resource_manager.render_text(self.font, f"Loading... {int(self.progress * 100)}%", (230, 230, 230))
+        screen.blit(text, text.get_rect(midbottom=(w // 2, bar.y - 10)))
@@ -5,14 +5,24 @@ from src.sprites import BackgroundSprite
 from src.scenes.scene import Scene
 from src.interface.components import Button
 from src.core.services import scene_manager, sound_manager, input_manager
+from src.core.managers import AssetManifest, HitGrid
 from typing import override
 
 class MenuScene(Scene):
+    ASSETS = AssetManifest(
+        images=[
+            "backgrounds/background1.png",
+            "UI/button_play.png", "UI/button_play_hover.png",
+            "UI/button_setting.png", "UI/button_setting_hover.png",
+        ],
+        music=["RBY 101 Opening (Part 1).ogg"],
+    )
     # Background Image
     background: BackgroundSprite
     # Buttons
     play_button: Button
     setting_button: Button
+    hit_grid: HitGrid
     def __init__(self):
         super().__init__()
         self.background = BackgroundSprite("backgrounds/background1.png")
@@ -28,10 +38,12 @@ class MenuScene(Scene):
             px - 100, py, 100, 100,
             lambda: scene_manager.change_scene("setting")
         )
+        self.hit_grid = HitGrid([(button, button.hitbox) for button in (self.play_button, self.setting_button)])
     @override
     def enter(self) -> None:
         sound_manager.play_bgm("RBY 101 Opening (Part 1).ogg")
-        pass
+        # The game scene is the likely next stop, get its images decoding now
+        scene_manager.warm_up("game")
 
     @override
     def exit(self) -> None:
@@ -42,11 +54,16 @@ class MenuScene(Scene):
         if input_manager.key_pressed(pg.K_SPACE):
             scene_manager.change_scene("game")
             return
-        self.play_button.update(dt)
-        self.setting_button.update(dt)
+        input_manager.dispatch(self.hit_grid)
 
     @override
     def draw(self, screen: pg.Surface) -> None:
         self.background.draw(screen)
         self.play_button.draw(screen)
         self.setting_button.draw(screen)
+
+    @override
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        # Only the buttons ever change on the menu
+        buttons = (self.play_button, self.setting_button)
+        return [rect for button in buttons if (rect := button.dirty_rect()) is not None]
@@ -1,7 +1,15 @@
 import pygame as pg
-from src.utils import GameSettings, PositionCamera
+from src.core.managers import HitGrid, PointerTarget
 
-class Minimap:
+# 滾輪每格放大 / 縮小兩倍，最多放大這麼多倍
+MINIMAP_MAX_ZOOM = 8
+
+class Minimap(PointerTarget):
+    """
+    小地圖。滾輪縮放、拖曳平移 (放大時以玩家為中心)。
+    縮圖取自地圖的 mip 金字塔 (Map.mip)，縮放不用重新畫地圖。
+    用 add_to() 加進 HitGrid，滑鼠事件由 input_manager.dispatch 送來。
+    """
     def __init__(self, game_scene):
         self.game_scene = game_scene
         self.game_manager = game_scene.game_manager
@@ -13,99 +21,183 @@ class Minimap:
         self.y = 20        # 距離上邊界
         self.border_color = (200, 200, 200)
 
-        # --- 縮圖相關變數 ---
-        self.cached_map_surface = None
-        self.last_map_name = None
-        self.scale = 1.0
+        # --- 縮放與平移 ---
+        self.zoom = 1
+        self.pan = pg.Vector2(0, 0)     # 視野中心相對玩家的偏移 (世界座標)
+        self.dragging = False
+        self.drag_pos = (0, 0)
+        self.grid: HitGrid | None = None    # 高度改變時要更新在 HitGrid 裡的範圍
 
-    def _generate_scaled_map_image(self, current_map):
-        """ 生成縮圖，並自動調整小地圖的高度以完美貼合 """
-        print("Generating fitted minimap image...")
+        # --- 目前視野 (世界座標 left, top, width, height) 與縮放比例 ---
+        self.view = (0.0, 0.0, 1.0, 1.0)
+        self.scale = 1.0
 
-        # 1. 取得地圖真實的總像素寬高
-        if hasattr(current_map, "tmx_data"):
-            real_map_w = current_map.tmx_data.width * current_map.tmx_data.tilewidth
-            real_map_h = current_map.tmx_data.height * current_map.tmx_data.tileheight
+        # --- 地圖縮圖：放大時多畫視野四周各一個視野大小，平移只改取用的位置 ---
+        # 視野移出這個範圍，或地圖、縮放、高度變了才重畫
+        self.map_layer = None
+        self.map_state = None
+        self.map_src = pg.Rect(0, 0, 0, 0)     # 縮圖涵蓋的範圍 (mip 層座標)
+
+        # --- 視野那塊縮圖、邊框與不會動的標記 (敵人、商店 NPC) 合成一張，視野或標記變了才重畫 ---
+        self.layer_margin = 5   # 圓點可能超出小地圖邊緣
+        self.layer = None
+        self.layer_state = None
+
+    @property
+    def rect(self) -> pg.Rect:
+        return pg.Rect(self.x, self.y, self.width, self.height)
+
+    def add_to(self, grid: HitGrid) -> None:
+        self.grid = grid
+        grid.add(self, self.rect)
+
+    # ==========================================
+    # 滑鼠操作
+    # ==========================================
+    def on_press(self, pos):
+        if self.rect.collidepoint(pos) and self.zoom > 1:
+            self.dragging = True
+            self.drag_pos = pos
+
+    def on_drag(self, pos):
+        if self.dragging:
+            # 拖曳方向與視野移動方向相反
+            self.pan -= pg.Vector2(pos[0] - self.drag_pos[0], pos[1] - self.drag_pos[1]) / self.scale
+            self.drag_pos = pos
+
+    def on_release(self, pos):
+        self.dragging = False
+
+    def on_wheel(self, steps, pos):
+        self.zoom = max(1, min(MINIMAP_MAX_ZOOM, self.zoom * 2 ** steps))
+        if self.zoom == 1:
+            self.pan.update(0, 0)
+
+    # ==========================================
+    # 繪製
+    # ==========================================
+    def _update_view(self, current_map):
+        """ 依縮放與平移算出視野，並自動調整小地圖的高度以完美貼合地圖比例 """
+        map_w, map_h = current_map.pixel_size
+        height = round(map_h * self.width / map_w)
+        if height != self.height:
+            self.height = height
+            if self.grid is not None:
+                self.grid.move(self, self.rect)
+
+        view_w, view_h = map_w / self.zoom, map_h / self.zoom
+        player = self.game_manager.player
+        if self.zoom > 1 and player:
+            center = pg.Vector2(player.position.x, player.position.y) + self.pan
         else:
-            real_map_w = getattr(current_map, "width", 67) * GameSettings.TILE_SIZE
-            real_map_h = getattr(current_map, "height", 38) * GameSettings.TILE_SIZE
-
-        # 2. 繪製完整的大地圖到暫存畫布
-        large_surface = pg.Surface((real_map_w, real_map_h)).convert()
-        dummy_camera = PositionCamera(0, 0)
-        current_map.draw(large_surface, dummy_camera)
-
-        # ==========================================
-        # [核心修改] 動態調整高度
-        # ==========================================
-        # 3. 固定寬度為 self.width (200)，計算縮放比例
-        self.scale = self.width / real_map_w
-        
-        # 4. 根據比例算出「完美高度」
-        new_h = int(real_map_h * self.scale)
-        
-        # [關鍵步驟] 更新小地圖的高度設定，讓框框變小
-        self.height = new_h 
-
-        # 5. 進行縮放
-        scaled_surface = pg.transform.smoothscale(large_surface, (self.width, self.height))
-        scaled_surface.set_alpha(220) # 設定半透明
+            center = pg.Vector2(map_w / 2, map_h / 2)
+        left = max(0, min(center.x - view_w / 2, map_w - view_w))
+        top = max(0, min(center.y - view_h / 2, map_h - view_h))
+        # 平移到地圖邊緣就停住，不要累積
+        if self.zoom > 1 and player:
+            self.pan.update(left + view_w / 2 - player.position.x, top + view_h / 2 - player.position.y)
+
+        self.view = (left, top, view_w, view_h)
+        self.scale = self.width / view_w
+
+    def _view_source(self, current_map):
+        """ 視野在 mip 層裡的範圍：(層, 範圍)。視野對齊到層的像素，地圖和圓點才不會錯開 """
+        level, level_scale = current_map.mip(self.scale)
+        src = pg.Rect([round(v * level_scale) for v in self.view]).clip(level.get_rect())
+        self.view = tuple(v / level_scale for v in src)
+        self.scale = self.width / self.view[2]
+        return level, level_scale, src
+
+    def get_mini_pos(self, world_x, world_y):
+        # 公式簡化：(世界座標 - 視野左上) * 縮放比 + 小地圖起始點
+        mx = (world_x - self.view[0]) * self.scale + self.x
+        my = (world_y - self.view[1]) * self.scale + self.y
+        return int(mx), int(my)
+
+    def _static_markers(self):
+        """ 敵人 (紅點) 與商店 NPC (藍點) 的世界座標 """
+        markers = []
+        for enemy in self.game_manager.current_enemy_trainers:
+            markers.append(((255, 0, 0), enemy.position.x, enemy.position.y))
 
-        return scaled_surface
+        # 確保 game_scene 裡有 shop_npcs 這個列表
+        for npc in getattr(self.game_scene, "shop_npcs", []):
+            # 取得 NPC 的世界座標 (相容 rect 或 position 屬性)
+            if hasattr(npc, "rect"):
+                markers.append(((0, 0, 255), npc.rect.centerx, npc.rect.centery))
+            elif hasattr(npc, "position"):
+                markers.append(((0, 0, 255), npc.position.x, npc.position.y))
+        return tuple(markers)
+
+    def _render_map(self, level, src):
+        """ 半透明的地圖縮圖，src 縮放成小地圖大小，放大時連同四周各一個視野大小一起縮 """
+        cover = src if self.zoom == 1 else src.inflate(src.w, src.h).clip(level.get_rect())
+        size = (cover.w * self.width // src.w, cover.h * self.height // src.h)
+        layer = pg.Surface(size, pg.SRCALPHA)
+        layer.blit(pg.transform.smoothscale(level.subsurface(cover), size), (0, 0))
+        layer.fill((255, 255, 255, 220), special_flags=pg.BLEND_RGBA_MIN)
+        self.map_src = cover
+        return layer
+
+    def _render_layer(self, area, markers):
+        margin = self.layer_margin
+        layer = pg.Surface((self.width + margin * 2, self.height + margin * 2), pg.SRCALPHA)
+
+        # 1. 地圖縮圖 (半透明)，只取視野那一塊
+        # 新的 layer 全是 0，取 MAX 就是原封不動複製 (一般的 blit 會把半透明再混一次)
+        map_rect = pg.Rect(margin, margin, self.width, self.height)
+        layer.blit(self.map_layer, map_rect, area, special_flags=pg.BLEND_RGBA_MAX)
+
+        # 2. 邊框
+        pg.draw.rect(layer, self.border_color, map_rect, 2)
+
+        # 3. 敵人與商店 NPC (視野外的不畫)
+        visible = self.rect.inflate(margin * 2, margin * 2)
+        for color, world_x, world_y in markers:
+            mx, my = self.get_mini_pos(world_x, world_y)
+            if visible.collidepoint(mx, my):
+                pg.draw.circle(layer, color, (mx - self.x + margin, my - self.y + margin), 3)
+        return layer
 
     def draw(self, screen: pg.Surface):
         current_map = self.game_manager.current_map
         if not current_map:
             return
 
-        # 檢查是否需要重新生成縮圖
-        current_map_name = getattr(current_map, "path_name", "unknown")
-        if self.cached_map_surface is None or current_map_name != self.last_map_name:
-            # 重新生成並更新高度
-            self.cached_map_surface = self._generate_scaled_map_image(current_map)
-            self.last_map_name = current_map_name
+        self._update_view(current_map)
+        level, level_scale, src = self._view_source(current_map)
+
+        # 平移還在縮圖範圍內就不用重畫縮圖
+        state = (getattr(current_map, "path_name", "unknown"), level.get_size(), src.size, self.height)
+        if self.map_layer is None or state != self.map_state or not self.map_src.contains(src):
+            self.map_layer = self._render_map(level, src)
+            self.map_state = state
+
+        # 視野在縮圖裡的位置，視野也對齊到縮圖的像素，圓點才不會跟地圖錯開
+        cover = self.map_src
+        ax, ay = (src.x - cover.x) * self.width // src.w, (src.y - cover.y) * self.height // src.h
+        left = (cover.x + ax * src.w / self.width) / level_scale
+        top = (cover.y + ay * src.h / self.height) / level_scale
+        self.view = (left, top, self.view[2], self.view[3])
+
+        # 只有在縮圖、視野或標記變了才重畫
+        markers = self._static_markers()
+        layer_state = (state, tuple(cover), ax, ay, markers)
+        if self.layer is None or layer_state != self.layer_state:
+            self.layer = self._render_layer((ax, ay, self.width, self.height), markers)
+            self.layer_state = layer_state
 
         # ==========================================
         # 開始繪製
         # ==========================================
 
-        # 1. 繪製地圖縮圖 (現在不需要偏移量了，因為框框大小剛好等於圖片大小)
-        if self.cached_map_surface:
-            screen.blit(self.cached_map_surface, (self.x, self.y))
-
-        # 2. 繪製邊框 (使用更新後的 self.height)
-        pg.draw.rect(screen, self.border_color, (self.x, self.y, self.width, self.height), 2)
-
-        # --- 座標轉換小幫手函式 ---
-        def get_mini_pos(world_x, world_y):
-            # 公式簡化：世界座標 * 縮放比 + 小地圖起始點
-            mx = world_x * self.scale + self.x
-            my = world_y * self.scale + self.y
-            return int(mx), int(my)
+        # 1~3. 地圖縮圖、邊框、敵人與商店 NPC (預先畫好)
+        screen.blit(self.layer, (self.x - self.layer_margin, self.y - self.layer_margin))
 
-        # 3. 繪製玩家 (綠點帶黑邊)
+        # 4. 繪製玩家 (綠點帶黑邊)，每幀都會動
         player = self.game_manager.player
         if player:
-            mini_pos = get_mini_pos(player.position.x, player.position.y)
-            pg.draw.circle(screen, (0, 0, 0), mini_pos, 5) # 黑邊
-            pg.draw.circle(screen, (0, 255, 0), mini_pos, 4) # 綠底
-
-        # 4. 繪製敵人 (紅點)
-        for enemy in self.game_manager.current_enemy_trainers:
-            mini_pos = get_mini_pos(enemy.position.x, enemy.position.y)
-            pg.draw.circle(screen, (255, 0, 0), mini_pos, 3)
-
-        # 5. 繪製商店 NPC (藍點)
-        # 確保 game_scene 裡有 shop_npcs 這個列表
-        if hasattr(self.game_scene, "shop_npcs"):
-            for npc in self.game_scene.shop_npcs:
-                # 取得 NPC 的世界座標 (相容 rect 或 position 屬性)
-                if hasattr(npc, "rect"):
-                    world_x, world_y = npc.rect.centerx, npc.rect.centery
-                elif hasattr(npc, "position"):
-                    world_x, world_y = npc.position.x, npc.position.y
-                else:
-                    continue 
-
-                mini_pos = get_mini_pos(world_x, world_y)
-                pg.draw.circle(screen, (0, 0, 255), mini_pos, 3)
\ No newline at end of file
+            mini_pos = self.get_mini_pos(player.position.x, player.position.y)
+            if self.rect.collidepoint(mini_pos):
+                pg.draw.circle(screen, (0, 0, 0), mini_pos, 5) # 黑邊
+                pg.draw.circle(screen, (0, 255, 0), mini_pos, 4) # 綠底
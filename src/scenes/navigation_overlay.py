@@ -2,9 +2,11 @@ import pygame as pg
 from src.scenes.scene import Scene
 from src.utils import GameSettings, Logger
 from src.utils.pathfinder import find_path
+from src.core.services import resource_manager, input_manager
+from src.core.managers import PointerTarget, HitGrid
 
 # --- 定義一個專用的簡易按鈕類別 (包含下壓效果) ---
-class SimpleNavButton:
+class SimpleNavButton(PointerTarget):
     def __init__(self, x, y, width, height, text, font, action_func, action_arg):
         self.rect = pg.Rect(x, y, width, height)
         self.text = text
@@ -15,7 +17,6 @@ class SimpleNavButton:
         # 狀態
         self.is_hovered = False
         self.is_pressed = False
-        self.was_mouse_down = False
 
         # 顏色設定
         self.color_normal = (255, 255, 255) # 白底
@@ -23,24 +24,21 @@ class SimpleNavButton:
         self.color_text = (0, 0, 0)         # 黑字
         self.color_shadow = (50, 50, 50)    # 陰影顏色
 
-    def update(self):
-        mouse_pos = pg.mouse.get_pos()
-        mouse_buttons = pg.mouse.get_pressed()
-        is_left_down = mouse_buttons[0]
-
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+    def on_hover(self, hovered):
+        self.is_hovered = hovered
+        # 按著滑鼠移進來也算按下，移出去就取消
+        self.is_pressed = hovered and input_manager.mouse_down(1)
 
+    def on_press(self, pos):
         # 判斷點擊邏輯 (下壓效果)
-        if self.is_hovered:
-            if is_left_down:
-                self.is_pressed = True
-            else:
-                # 如果剛剛是按下的，現在放開了 -> 觸發事件
-                if self.is_pressed:
-                    self.action_func(self.action_arg)
-                self.is_pressed = False
-        else:
+        self.is_pressed = True
+
+    def on_release(self, pos):
+        # 如果剛剛是按下的，現在放開了 -> 觸發事件
+        if self.is_pressed and self.is_hovered:
             self.is_pressed = False
+            self.action_func(self.action_arg)
+        self.is_pressed = False
             
     def draw(self, screen):
         # 繪製陰影 (總是畫在原始位置的右下角)
@@ -64,7 +62,7 @@ class SimpleNavButton:
         pg.draw.rect(screen, (0, 0, 0), draw_rect, 3, border_radius=8) # 黑色邊框
 
         # 繪製文字
-        text_surf = self.font.render(self.text, True, self.color_text)
+        text_surf = resource_manager.render_text(self.font, self.text, self.color_text)
         text_rect = text_surf.get_rect(center=draw_rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -78,10 +76,11 @@ class NavigationOverlay(Scene):
         self.game_manager = getattr(game_scene, "game_manager", None)
 
         # 使用粗體字型會好看一點
-        self.font = pg.font.SysFont("arial", 40, bold=True)
+        self.font = resource_manager.get_sys_font("arial", 40, bold=True)
         
         self.buttons = []
         self.create_buttons()
+        self.hit_grid = HitGrid([(btn, btn.rect) for btn in self.buttons])
 
     def create_buttons(self):
         btn_width, btn_height = 240, 70
@@ -167,17 +166,14 @@ class NavigationOverlay(Scene):
                 print(f"Navigation Error: {e}")
 
     def update(self, dt):
-        for btn in self.buttons:
-            btn.update()
+        input_manager.dispatch(self.hit_grid)
 
     def draw(self, screen):
         # 畫半透明黑色背景
-        overlay = pg.Surface(screen.get_size(), pg.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
+        screen.blit(resource_manager.get_dim_layer(screen.get_size(), (0, 0, 0, 150)), (0, 0))
         
-        # 標題
-        title_surf = self.font.render("Where to go?", True, (255, 255, 255))
+        # 標題 (畫在半透明背景上會混色，所以不預先合成)
+        title_surf = resource_manager.render_text(self.font, "Where to go?", (255, 255, 255))
         title_rect = title_surf.get_rect(center=(screen.get_width()//2, 80))
         screen.blit(title_surf, title_rect)
 
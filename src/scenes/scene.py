@@ -15,4 +15,11 @@ class Scene:
         ...
 
     def draw(self, screen: pg.Surface) -> None:
-        ...
\ No newline at end of file
+        ...
+
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        """
+        Screen regions that changed since the last call, used by the dirty-rect renderer.
+        None (the default) redraws the whole screen; an empty list skips the frame.
+        """
+        return None
\ No newline at end of file
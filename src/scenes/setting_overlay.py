@@ -1,27 +1,25 @@
 import pygame as pg
-from src.core.services import input_manager, sound_manager
+from src.core.services import input_manager, sound_manager, resource_manager
 from src.interface.components.button import Button
+from src.core.managers import PointerTarget, HitGrid
 from src.core.managers.game_manager import GameManager
 
 
 # ========================================
 # Checkbox UI
 # ========================================
-class Checkbox:
+class Checkbox(PointerTarget):
     def __init__(self, x, y, label, default=False):
         self.x = x
         self.y = y
         self.size = 30
         self.checked = default
         self.label = label
-        self.font = pg.font.SysFont(None, 32)
+        self.font = resource_manager.get_sys_font(None, 32)
         self.rect = pg.Rect(x, y, self.size, self.size)
 
-    def update(self, dt):
-        mouse_pos = input_manager.mouse_pos
-        mouse_click = input_manager.mouse_pressed(1)
-        if self.rect.collidepoint(mouse_pos) and mouse_click:
-            self.checked = not self.checked
+    def on_press(self, pos):
+        self.checked = not self.checked
 
     def draw(self, screen: pg.Surface):
         pg.draw.rect(screen, (50, 50, 50), self.rect)
@@ -35,14 +33,14 @@ class Checkbox:
                          (self.x + self.size, self.y),
                          (self.x, self.y + self.size), 3)
 
-        text_surf = self.font.render(self.label, True, (0, 0, 0))
+        text_surf = resource_manager.render_text(self.font, self.label, (0, 0, 0))
         screen.blit(text_surf, (self.x + 40, self.y - 2))
 
 
 # ========================================
 # Slider UI (可正常滑動版本)
 # ========================================
-class Slider:
+class Slider(PointerTarget):
     def __init__(self, x, y, width, min_value=0, max_value=100, default=50):
         self.x = x
         self.y = y
@@ -53,32 +51,32 @@ class Slider:
         self.knob_radius = 12
 
         self.dragging = False
-        self.knob_rect = pg.Rect(0, 0, self.knob_radius*2, self.knob_radius*2)
+        # knob 可能在 bar 上任何位置，整條加進 HitGrid
+        self.rect = pg.Rect(x - self.knob_radius, y - self.knob_radius,
+                            width + self.knob_radius*2, self.knob_radius*2)
 
     @property
     def knob_x(self):
         return int(self.x + (self.value - self.min_value) /
                    (self.max_value - self.min_value) * self.width)
 
-    def update(self, dt):
-        mouse_pos = pg.mouse.get_pos()
-        mouse_pressed = pg.mouse.get_pressed()[0]
-
-        self.knob_rect.center = (self.knob_x, self.y)
-
-        # 開始拖曳
-        if mouse_pressed:
-            if self.knob_rect.collidepoint(mouse_pos) and not self.dragging:
-                self.dragging = True
-        else:
-            self.dragging = False
+    def on_press(self, pos):
+        # 點到 knob 開始拖曳
+        knob_rect = pg.Rect(0, 0, self.knob_radius*2, self.knob_radius*2)
+        knob_rect.center = (self.knob_x, self.y)
+        if knob_rect.collidepoint(pos):
+            self.dragging = True
 
+    def on_drag(self, pos):
         # 拖曳中：更新滑桿值
         if self.dragging:
-            new_x = max(self.x, min(mouse_pos[0], self.x + self.width))
+            new_x = max(self.x, min(pos[0], self.x + self.width))
             percent = (new_x - self.x) / self.width
             self.value = int(self.min_value + percent * (self.max_value - self.min_value))
 
+    def on_release(self, pos):
+        self.dragging = False
+
     def draw(self, screen: pg.Surface):
         # bar
         pg.draw.line(screen, (120, 120, 120), (self.x, self.y),
@@ -89,8 +87,8 @@ class Slider:
                        (self.knob_x, self.y), self.knob_radius)
 
         # text
-        font = pg.font.SysFont(None, 28)
-        text_surf = font.render(f"Volume: {self.value}", True, (0, 0, 0))
+        font = resource_manager.get_sys_font(None, 28)
+        text_surf = resource_manager.render_text(font, f"Volume: {self.value}", (0, 0, 0))
         screen.blit(text_surf, (self.x, self.y - 30))
 
 
@@ -127,6 +125,10 @@ class SettingOverlay:
 
         self.buttons.extend([self.save_button, self.load_button, self.back_button])
 
+        self.hit_grid = HitGrid([(btn, btn.hitbox) for btn in self.buttons])
+        self.hit_grid.add(self.checkbox_mute, self.checkbox_mute.rect)
+        self.hit_grid.add(self.slider_volume, self.slider_volume.rect)
+
     def save_game(self):
         if self.game_scene.game_manager:
             self.game_scene.game_manager.save("saves/game0.json")
@@ -135,6 +137,8 @@ class SettingOverlay:
     def load_game(self):
         gm = GameManager.load("saves/game0.json")
         if gm:
+            # 舊的 GameManager 還在背景讀的地圖不需要了
+            self.game_scene.game_manager.prefetcher.cancel()
             self.game_scene.game_manager = gm
             
 
@@ -142,11 +146,7 @@ class SettingOverlay:
         self.game_scene.overlay_type = None
 
     def update(self, dt):
-        for btn in self.buttons:
-            btn.update(dt)
-
-        self.checkbox_mute.update(dt)
-        self.slider_volume.update(dt)
+        input_manager.dispatch(self.hit_grid)
 
         # --- 音量邏輯 ---
         if self.checkbox_mute.checked:
@@ -157,17 +157,19 @@ class SettingOverlay:
             volume_float = self.slider_volume.value / 100
             sound_manager.set_volume(volume_float)
 
-    def draw(self, screen: pg.Surface):
+    def draw_background(self, layer: pg.Surface):
         # 背景半透明
-        overlay = pg.Surface(screen.get_size(), pg.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        layer.fill((0, 0, 0, 180))
 
         # 白色面板
-        panel_rect = pg.Rect(screen.get_width()//2 - 280,
-                             screen.get_height()//2 - 250,
+        panel_rect = pg.Rect(layer.get_width()//2 - 280,
+                             layer.get_height()//2 - 250,
                              600, 500)
-        pg.draw.rect(screen, (240, 240, 240), panel_rect, border_radius=12)
+        pg.draw.rect(layer, (240, 240, 240), panel_rect, border_radius=12)
+
+    def draw(self, screen: pg.Surface):
+        # 背景與面板只畫一次
+        screen.blit(resource_manager.get_layer("setting_overlay", screen.get_size(), self.draw_background), (0, 0))
 
         # Buttons
         for btn in self.buttons:
@@ -1,6 +1,9 @@
 import pygame as pg
 from src.utils import GameSettings
+from src.core.services import resource_manager, input_manager
+from src.core.managers import HitGrid
 from src.interface.components.button import Button
+from src.interface.components.widget import Label, Panel
 from src.sprites import Sprite
 
 class ShopOverlay:
@@ -15,10 +18,10 @@ class ShopOverlay:
         self.y = (GameSettings.SCREEN_HEIGHT - self.height) // 2
 
         # --- 字體 ---
-        self.font_title = pg.font.SysFont("arial", 28, bold=True)
-        self.font_item = pg.font.SysFont("arial", 22)
-        self.font_price = pg.font.SysFont("arial", 20, bold=True)
-        self.font_msg = pg.font.SysFont("arial", 18, italic=True) # 顯示購買訊息用
+        self.font_title = resource_manager.get_sys_font("arial", 28, bold=True)
+        self.font_item = resource_manager.get_sys_font("arial", 22)
+        self.font_price = resource_manager.get_sys_font("arial", 20, bold=True)
+        self.font_msg = resource_manager.get_sys_font("arial", 18, italic=True) # 顯示購買訊息用
 
         # --- 商店商品清單 ---
         self.shop_items = [
@@ -36,6 +39,7 @@ class ShopOverlay:
 
         # 購買狀態訊息 (例如: "Bought Potion!", "Not enough coins!")
         self.message = ""
+        self.message_color = (0, 0, 0)
         self.message_timer = 0
 
         # --- UI 元件容器 ---
@@ -56,6 +60,17 @@ class ShopOverlay:
             self.close_overlay
         )
         self.buttons.append(self.close_button)
+        self.hit_grid = HitGrid([(btn, btn.hitbox) for btn in self.buttons])
+
+        # 3. 面板與商品列表只畫一次，金幣與購買訊息變了才重畫那一行字
+        self.panel = Panel(
+            "shop_overlay", (self.x, self.y, self.width, self.height), self.draw_background,
+            children=[
+                Label(self.font_item, lambda: f"Your Coins: {self.current_coins()}", (100, 100, 100), (self.x + 350, self.y + 25)),
+                Label(self.font_msg, lambda: self.message, lambda: self.message_color, (self.x + 30, self.y + self.height - 40)),
+            ],
+            border=(50, 50, 50), border_width=3,
+        )
 
     def init_shop_items(self):
         """ 初始化商品列表的圖片與購買按鈕 """
@@ -164,8 +179,7 @@ class ShopOverlay:
             return
         
         # 更新按鈕
-        for btn in self.buttons:
-            btn.update(dt)
+        input_manager.dispatch(self.hit_grid)
 
         # 更新訊息計時器
         if self.message_timer > 0:
@@ -174,38 +188,22 @@ class ShopOverlay:
                 self.message_timer = 0
                 self.message = ""
 
-    def draw(self, screen: pg.Surface):
-        if not self.visible:
-            return
-
-        # 1. 半透明背景
-        overlay_bg = pg.Surface(screen.get_size(), pg.SRCALPHA)
-        overlay_bg.fill((0, 0, 0, 180))
-        screen.blit(overlay_bg, (0, 0))
-
-        # 2. 商店面板
-        panel_rect = pg.Rect(self.x, self.y, self.width, self.height)
-        pg.draw.rect(screen, (240, 240, 240), panel_rect, border_radius=12)
-        pg.draw.rect(screen, (50, 50, 50), panel_rect, 3, border_radius=12)
-
-        # 3. 標題
-        title = self.font_title.render("Item Shop", True, (0, 0, 0))
-        screen.blit(title, (self.x + 30, self.y + 20))
-
-        # 4. 顯示玩家目前的錢 (從 GM 抓取)
+    def current_coins(self) -> int:
+        """ 玩家目前的錢 (從 GM 抓取) """
         gm = self.game_scene.game_manager
         player_items = getattr(gm.bag, "items", []) or getattr(gm.bag, "_items_data", [])
-        current_coins = 0
         for item in player_items:
             if item['name'] == "Coins":
-                current_coins = item['count']
-                break
-        
-        coin_text = self.font_item.render(f"Your Coins: {current_coins}", True, (100, 100, 100))
-        screen.blit(coin_text, (self.x + 350, self.y + 25))
+                return item['count']
+        return 0
+
+    def draw_background(self, layer: pg.Surface):
+        """ 不會變的部分只畫一次 (面板座標)：標題、商品列表，面板本身由 Panel 畫 """
+        # 3. 標題
+        layer.blit(self.font_title.render("Item Shop", True, (0, 0, 0)), (30, 20))
 
         # 5. 繪製商品列表
-        start_y = self.y + 80
+        start_y = 80
         item_height = 80
         spacing = 10
 
@@ -215,28 +213,26 @@ class ShopOverlay:
             # (A) 商品圖
             sprite = self.sprites.get(idx)
             if sprite and sprite.image:
-                screen.blit(sprite.image, (self.x + 40, current_y))
+                layer.blit(sprite.image, (40, current_y))
             else:
-                pg.draw.rect(screen, (255, 100, 100), (self.x + 40, current_y, 60, 60))
+                pg.draw.rect(layer, (255, 100, 100), (40, current_y, 60, 60))
 
             # (B) 名稱與價格
-            name_text = self.font_item.render(item["name"], True, (20, 20, 20))
-            screen.blit(name_text, (self.x + 120, current_y + 10))
-
-            price_text = self.font_price.render(f"$ {item['price']}", True, (200, 150, 0))
-            screen.blit(price_text, (self.x + 120, current_y + 35))
+            layer.blit(self.font_item.render(item["name"], True, (20, 20, 20)), (120, current_y + 10))
+            layer.blit(self.font_price.render(f"$ {item['price']}", True, (200, 150, 0)), (120, current_y + 35))
 
             # 分隔線
-            pg.draw.line(screen, (200, 200, 200), 
-                         (self.x + 20, current_y + item_height + 5), 
-                         (self.x + self.width - 20, current_y + item_height + 5))
+            pg.draw.line(layer, (200, 200, 200), 
+                         (20, current_y + item_height + 5), 
+                         (self.width - 20, current_y + item_height + 5))
+
+    def draw(self, screen: pg.Surface):
+        if not self.visible:
+            return
 
-        # 6. 繪製訊息 (購買成功/失敗)
-        if self.message:
-            msg_surf = self.font_msg.render(self.message, True, self.message_color)
-            # 顯示在面板下方中間
-            screen.blit(msg_surf, (self.x + 30, self.y + self.height - 40))
+        # 1~6. 背景、面板、標題、金幣、商品列表、購買訊息 (都是預先畫好的)
+        self.panel.draw(screen)
 
         # 7. 繪製按鈕
         for btn in self.buttons:
-            btn.draw(screen)
\ No newline at end of file
+            btn.draw(screen)
@@ -1,12 +1,45 @@
 import pygame as pg
 
 from .sprite import Sprite
+from src.core.services import resource_manager
 from src.utils import GameSettings, Logger, PositionCamera
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+AnimationFrames = Mapping[str, tuple[pg.Surface, ...]]
+
+# Sliced and scaled sheets, shared by every Animation with the same
+# (sheet, rows, keyframes, size). Nothing may draw on these frames.
+_atlas: dict[tuple[str, tuple[str, ...], int, tuple[int, int]], AnimationFrames] = {}
+
+def animation_frames(image_path: str, rows: list[str], n_keyframes: int, size: tuple[int, int]) -> AnimationFrames:
+    key = (image_path, tuple(rows), n_keyframes, tuple(size))
+    if key in _atlas:
+        return _atlas[key]
+
+    if (len(rows) <= 0 or n_keyframes <= 0):
+        Logger.error("Invalid number of rows")
+
+    sheet = resource_manager.get_image(image_path)
+    sheet_w, sheet_h = sheet.get_size()
+    frame_w = sheet_w // n_keyframes
+    frame_h = sheet_h // len(rows)
+
+    frames: dict[str, tuple[pg.Surface, ...]] = {}
+    for r, name in enumerate(rows):
+        frames[name] = tuple(
+            pg.transform.smoothscale(sheet.subsurface(pg.Rect(
+                c * frame_w, r * frame_h,
+                frame_w, frame_h
+            )), size)
+            for c in range(n_keyframes)
+        )
+    _atlas[key] = MappingProxyType(frames)
+    return _atlas[key]
 
 class Animation(Sprite):
-    # Animations
-    animations: dict[str, list[pg.Surface]]
+    # Animations, shared with every other Animation of the same sheet and size
+    animations: AnimationFrames
     cur_row: str
     # Time information for selections
     accumulator: float  # time elapsed
@@ -19,24 +52,8 @@ class Animation(Sprite):
         size: tuple[int, int],              # Size of the animation in rendering
         loop: float = 1                     # loop in second
     ):
-        super().__init__(image_path)
-        sheet_w, sheet_h = self.image.get_size()
-        frame_w = sheet_w // n_keyframes
-        frame_h = sheet_h // len(rows)
-        
-        if (len(rows) <= 0 or n_keyframes <= 0):
-            Logger.error("Invalid number of rows")
-        
-        self.animations = {}
-        for r, name in enumerate(rows):
-            anim : list[pg.Surface] = []
-            for c in range(n_keyframes):
-                frame = self.image.subsurface(pg.Rect(
-                    c * frame_w, r * frame_h,
-                    frame_w, frame_h
-                ))
-                anim.append(pg.transform.smoothscale(frame, size))
-            self.animations[name] = anim
+        self.animations = animation_frames(image_path, rows, n_keyframes, size)
+        self.image = self.animations[rows[0]][0]
             
         self.accumulator = 0
         self.cur_row = rows[0]
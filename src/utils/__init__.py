@@ -2,13 +2,16 @@
 
 from .logger import Logger
 from .settings import GameSettings
-from .loader import load_tmx, load_img, load_font, load_sound
+from .loader import load_tmx, parse_tmx, load_tmx_images, load_img, load_font, load_sound
 from .definition import Position, PositionCamera, Direction, MouseBtn, Key, Teleport
+from .profiler import profiler
 
 __all__ = [
     "Logger",
     "GameSettings",
     "load_tmx",
+    "parse_tmx",
+    "load_tmx_images",
     "load_img",
     "load_font",
     "load_sound",
@@ -18,4 +21,5 @@ __all__ = [
     "MouseBtn",
     "Key",
     "Teleport",
+    "profiler",
 ]
\ No newline at end of file
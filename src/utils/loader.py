@@ -1,5 +1,6 @@
 import pygame as pg
 from pytmx import load_pygame, TiledMap
+from pytmx.util_pygame import pygame_image_loader
 from pathlib import Path
 from .logger import Logger
 
@@ -31,3 +32,16 @@ def load_tmx(path: str) -> TiledMap:
     if tmxdata is None:
         Logger.error(f"Failed to load map: {path}")
     return tmxdata
+
+def parse_tmx(path: str) -> TiledMap:
+    """
+    Parse a TMX file without loading its tile images. Touches no pygame
+    surfaces, so it can run off the main thread; finish with load_tmx_images.
+    """
+    return TiledMap(str(ASSETS_DIR / "maps" / path))
+
+def load_tmx_images(tmxdata: TiledMap) -> TiledMap:
+    """Load the tile images of a map from parse_tmx, as load_tmx would have. Main thread only."""
+    tmxdata.image_loader = pygame_image_loader
+    tmxdata.reload_images()
+    return tmxdata
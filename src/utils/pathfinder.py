@@ -2,88 +2,106 @@ import heapq
 import pygame as pg
 from src.utils import GameSettings, Logger
 
-class Node:
-    def __init__(self, x, y, parent=None):
-        self.x = x
-        self.y = y
-        self.parent = parent
-        self.g = 0
-        self.h = 0
-        self.f = 0
-
-    def __lt__(self, other):
-        return self.f < other.f
+# 上下左右
+NEIGHBORS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# 最多展開這麼多格就放棄 (只用在沒有可走格子表的地圖，有的話整張地圖都能搜)
+MAX_ITERATIONS = 3000
+
+# 檢查障礙物時，格子每一邊縮減的像素
+WALK_MARGIN = 4
 
 def find_path(start_pos, end_pos, game_map):
     """
-    A* 尋路演算法
+    A* 尋路演算法，回傳從起點到終點 (含兩端) 的格子座標列表，找不到回傳 None。
+
+    g 值存在 dict 裡；heap 不做 decrease-key，找到更短的路就再 push 一筆，
+    舊的那筆 pop 出來時已經在 closed 裡就直接略過 (lazy deletion)。
+    f 相同時先展開離終點近的 (h 小) 的格子。
+    地圖有 walkability() 時直接查預先算好的可走格子表，搜尋範圍就是整張地圖。
     """
+    walkable, max_iterations = _walkable_lookup(game_map)
+
     # 0. 預先檢查：如果目標點本身就是牆壁，直接放棄，不用浪費時間運算
-    if not is_walkable(game_map, end_pos[0], end_pos[1]):
+    if not walkable(end_pos[0], end_pos[1]):
         Logger.warning(f"Target {end_pos} is a wall or obstacle! Pathfinding aborted.")
         return None
-    
+
     # 如果起點跟終點一樣
     if start_pos == end_pos:
         return []
 
-    start_node = Node(start_pos[0], start_pos[1])
-    end_node = Node(end_pos[0], end_pos[1])
-
-    open_list = []
-    closed_list = set()
-
-    heapq.heappush(open_list, start_node)
-
-    max_iterations = 3000 #稍微調高一點上限
-    iterations = 0
-
-    while open_list:
-        iterations += 1
-        if iterations > max_iterations:
-            Logger.warning(f"Pathfinding timeout. Searched {len(closed_list)} tiles.")
+    start = (start_pos[0], start_pos[1])
+    ex, ey = end_pos[0], end_pos[1]
+    end = (ex, ey)
+
+    h = abs(start[0] - ex) + abs(start[1] - ey)
+    open_heap = [(h, h, start)]     # (f, h, 格子)
+    g_score = {start: 0}
+    came_from = {}
+    closed = set()
+
+    while open_heap:
+        _, _, current = heapq.heappop(open_heap)
+        if current in closed:
+            continue    # 已經用更短的路展開過了
+        closed.add(current)
+        if len(closed) > max_iterations:
+            Logger.warning(f"Pathfinding timeout. Searched {len(closed)} tiles.")
             return None
 
-        current_node = heapq.heappop(open_list)
-        closed_list.add((current_node.x, current_node.y))
-
         # 找到終點
-        if current_node.x == end_node.x and current_node.y == end_node.y:
-            path = []
-            curr = current_node
-            while curr is not None:
-                path.append((curr.x, curr.y))
-                curr = curr.parent
+        if current == end:
+            path = [current]
+            while current in came_from:
+                current = came_from[current]
+                path.append(current)
             return path[::-1]
 
-        neighbors = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-        for offset in neighbors:
-            neighbor_pos = (current_node.x + offset[0], current_node.y + offset[1])
-
-            if neighbor_pos in closed_list:
+        x, y = current
+        g = g_score[current] + 1
+        for dx, dy in NEIGHBORS:
+            nx, ny = x + dx, y + dy
+            neighbor = (nx, ny)
+            if neighbor in closed or g >= g_score.get(neighbor, g + 1):
                 continue
-
             # 檢查鄰居是否可走
-            if not is_walkable(game_map, neighbor_pos[0], neighbor_pos[1]):
+            if not walkable(nx, ny):
                 continue
-
-            neighbor = Node(neighbor_pos[0], neighbor_pos[1], current_node)
-            neighbor.g = current_node.g + 1
-            neighbor.h = abs(neighbor.x - end_node.x) + abs(neighbor.y - end_node.y)
-            neighbor.f = neighbor.g + neighbor.h
-
-            existing_node = next((n for n in open_list if n.x == neighbor.x and n.y == neighbor.y), None)
-            if existing_node and existing_node.g < neighbor.g:
-                continue
-
-            heapq.heappush(open_list, neighbor)
+            g_score[neighbor] = g
+            came_from[neighbor] = current
+            h = abs(nx - ex) + abs(ny - ey)
+            heapq.heappush(open_heap, (g + h, h, neighbor))
 
     return None
 
+def _walkable_lookup(game_map):
+    """ (判斷格子可不可走的函式, 最多展開幾格) """
+    if hasattr(game_map, 'walkability'):
+        grid, map_w, map_h = game_map.walkability(WALK_MARGIN)
+        def walkable(x, y):
+            return 0 <= x < map_w and 0 <= y < map_h and grid[y * map_w + x] == 1
+        return walkable, len(grid)
+
+    # 其他地圖物件：is_walkable，但每一格只算一次
+    cache = {}
+    def walkable(x, y):
+        tile = (x, y)
+        result = cache.get(tile)
+        if result is None:
+            result = cache[tile] = is_walkable(game_map, x, y)
+        return result
+    return walkable, MAX_ITERATIONS
+
 def is_walkable(game_map, x, y):
     """
     判斷該座標是否可以行走 (更加寬容的版本)
     """
+    # 0. 地圖有預先算好的可走格子表就直接查
+    if hasattr(game_map, 'walkability'):
+        grid, map_w, map_h = game_map.walkability(WALK_MARGIN)
+        return 0 <= x < map_w and 0 <= y < map_h and grid[y * map_w + x] == 1
+
     # 1. 邊界檢查
     map_w, map_h = 0, 0
     if hasattr(game_map, 'map_data') and len(game_map.map_data) > 0:
@@ -104,7 +122,7 @@ def is_walkable(game_map, x, y):
     # [關鍵修改]：縮小檢查範圍
     # 我們不檢查完整的 32x32 格子，而是檢查中間的 24x24 區域
     # 這樣可以避免因為 "擦到牆壁邊緣" 就被判定為死路
-    margin = 4 # 每一邊縮減 4 pixels
+    margin = WALK_MARGIN # 每一邊縮減 4 pixels
     virtual_rect = pg.Rect(x * ts + margin, y * ts + margin, ts - margin*2, ts - margin*2)
 
     try:
@@ -0,0 +1,157 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import pygame as pg
+
+from .settings import GameSettings
+
+"""
+================== HOW TO USE PROFILER ==================
+Time a block : with profiler.section("draw.map"): ...
+End a frame  : profiler.end_frame()   (done by Engine)
+Overlay      : F3 toggles it, F4 dumps CSV + JSON
+When disabled, section() returns a shared no-op context.
+=========================================================
+"""
+
+_NULL_SECTION = nullcontext()
+
+# Histogram buckets, upper bounds in ms (the last one catches everything above)
+HISTOGRAM_BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 16, 33, float("inf"))
+
+
+class _Section:
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        frame = self._profiler._frame
+        frame[self._name] = frame.get(self._name, 0.0) + time.perf_counter() - self._start
+
+
+class Profiler:
+    """
+    Per-frame timings of named sections, kept over the last PROFILER_WINDOW frames.
+    A section entered several times in one frame (e.g. fixed-step updates) is summed.
+    """
+    enabled: bool
+    overlay_visible: bool
+    _frame: dict[str, float]
+    _history: dict[str, deque[float]]
+    _sections: dict[str, _Section]
+
+    def __init__(self):
+        self.enabled = GameSettings.PROFILER
+        self.overlay_visible = False
+        self._frame = {}
+        self._history = {}
+        self._sections = {}
+        self._font = None
+
+    def section(self, name: str):
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+        # Sections that didn't run this frame count as 0 so the windows stay aligned
+        for name in self._sections:
+            history = self._history.get(name)
+            if history is None:
+                history = self._history[name] = deque(maxlen=GameSettings.PROFILER_WINDOW)
+            history.append(self._frame.get(name, 0.0) * 1000)
+        self._frame.clear()
+
+    def toggle_overlay(self) -> None:
+        self.overlay_visible = not self.overlay_visible
+        # Showing the overlay turns profiling on; hiding it only turns it off
+        # again if it wasn't enabled in the settings
+        self.enabled = self.overlay_visible or GameSettings.PROFILER
+
+    def stats(self) -> dict[str, dict[str, object]]:
+        """avg / p50 / p95 / max in ms and a histogram over HISTOGRAM_BUCKETS, per section."""
+        result = {}
+        for name, history in sorted(self._history.items()):
+            if not history:
+                continue
+            ordered = sorted(history)
+            histogram = [0] * len(HISTOGRAM_BUCKETS)
+            for ms in history:
+                histogram[next(i for i, bound in enumerate(HISTOGRAM_BUCKETS) if ms <= bound)] += 1
+            result[name] = {
+                "frames": len(ordered),
+                "avg": sum(ordered) / len(ordered),
+                "p50": ordered[len(ordered) // 2],
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                "max": ordered[-1],
+                "histogram": histogram,
+            }
+        return result
+
+    def dump(self, directory: str | None = None) -> str:
+        """Write the per-frame samples as CSV and the summary as JSON. Returns the path stem."""
+        directory = directory or GameSettings.PROFILER_DUMP_DIR
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, time.strftime("profile-%Y%m%d-%H%M%S"))
+
+        names = sorted(self._history)
+        with open(stem + ".csv", "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + [f"{name} (ms)" for name in names])
+            frames = max((len(h) for h in self._history.values()), default=0)
+            for i in range(frames):
+                writer.writerow([i] + [
+                    f"{self._history[name][i]:.4f}" if i < len(self._history[name]) else ""
+                    for name in names
+                ])
+        with open(stem + ".json", "w") as f:
+            json.dump({"buckets_ms": [str(b) for b in HISTOGRAM_BUCKETS], "sections": self.stats()}, f, indent=2)
+        return stem
+
+    def draw(self, screen: pg.Surface) -> None:
+        if not self.overlay_visible:
+            return
+        if self._font is None:
+            self._font = pg.font.SysFont("monospace", 14)
+
+        stats = self.stats()
+        line_h = self._font.get_linesize()
+        # Columns are placed by hand, the font may not be monospaced
+        columns = (4, 150, 210, 270)
+        hist_x = 340
+        width = hist_x + max(len(HISTOGRAM_BUCKETS) * 6, 80) + 4
+        height = line_h * (len(stats) + 1) + 8
+        panel = pg.Surface((width, height), pg.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+
+        for x, label in zip(columns + (hist_x,), ("section", "avg ms", "p95", "max", "histogram")):
+            panel.blit(self._font.render(label, True, (255, 255, 0)), (x, 4))
+        for row, (name, s) in enumerate(stats.items(), start=1):
+            y = 4 + row * line_h
+            for x, text in zip(columns, (name, f"{s['avg']:.2f}", f"{s['p95']:.2f}", f"{s['max']:.2f}")):
+                panel.blit(self._font.render(text, True, (255, 255, 255)), (x, y))
+            # Rolling histogram: one bar per bucket, scaled to the busiest bucket
+            peak = max(s["histogram"]) or 1
+            for i, count in enumerate(s["histogram"]):
+                bar_h = max(1, (line_h - 2) * count // peak) if count else 0
+                pg.draw.rect(panel, (0, 200, 0), (hist_x + i * 6, y + line_h - 1 - bar_h, 5, bar_h))
+        screen.blit(panel, (8, 8))
+
+
+profiler = Profiler()
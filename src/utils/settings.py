@@ -5,14 +5,34 @@ class Settings:
     # Screen
     SCREEN_WIDTH: int = 1280    # Width of the game window
     SCREEN_HEIGHT: int = 720    # Height of the game window
-    FPS: int = 60               # Frames per second
+    FPS: int = 60               # Frames per second (render cap, 0 = uncapped)
+    FIXED_TIMESTEP: bool = True # Run game logic in fixed steps, independent of the render rate
+    UPDATE_RATE: int = 60       # Logic steps per second when FIXED_TIMESTEP is on
     TITLE: str = "I2P Final"    # Title of the game window
     DEBUG: bool = True          # Debug mode
     TILE_SIZE: int = 64         # Size of each tile in pixels
     DRAW_HITBOXES: bool = True  # Draw hitboxes for debugging
+    DIRTY_RECTS: bool = True    # Let scenes redraw only the regions that changed
+    HIT_GRID_CELL: int = 64     # Cell size of the grids used to find the widget under the mouse
     # Audio
     MAX_CHANNELS: int = 16
     AUDIO_VOLUME: float = 0.5   # Volume of audio
+    STREAM_BGM: bool = True     # Stream music from disk instead of decoding whole tracks into memory
+    # Asset loading
+    LOADING_SCREEN: bool = True             # Decode assets in the background behind a loading screen
+    ASSET_WORKERS: int = 4                  # Threads decoding images / sounds
+    SCENE_UNLOAD_AFTER: float = 60.0        # Seconds before an unvisited battle / catch scene is freed
+    RESOURCE_MEMORY_BUDGET: int = 128 * 2**20   # Bytes of cached images / sounds, least recently used go first
+    TEXT_CACHE_SIZE: int = 512              # Rendered text surfaces kept for reuse
+    # Map cache
+    MAP_CACHE: bool = True                  # Reuse baked maps from disk between launches
+    MAP_CACHE_DIR: str = ".cache/maps"      # Where baked maps are stored
+    MAP_MEMORY_BUDGET: int = 96 * 2**20     # Bytes of baked maps (with their minimap mips) kept loaded at once
+    MAP_PREFETCH_DISTANCE: int = 8          # Start loading a teleporter's destination this many tiles away
+    # Profiler
+    PROFILER: bool = False                  # Time frame sections from startup (F3 overlay turns it on too)
+    PROFILER_WINDOW: int = 300              # Frames kept for the rolling statistics
+    PROFILER_DUMP_DIR: str = ".cache/profiles"
     # Online
     IS_ONLINE: bool = False
     ONLINE_SERVER_URL: str = "http://localhost:8989"
@@ -0,0 +1,74 @@
+"""
+The on-disk baked map cache: a map loaded from the cache draws the same
+pixels as a freshly baked one, and files that are not ours are ignored.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from src.utils import GameSettings, Position
+
+MAP_NAME = "gym.tmx"
+
+
+class MapCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pg.init()
+        pg.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+        cls._settings = (GameSettings.MAP_CACHE, GameSettings.MAP_CACHE_DIR)
+
+    @classmethod
+    def tearDownClass(cls):
+        GameSettings.MAP_CACHE, GameSettings.MAP_CACHE_DIR = cls._settings
+        pg.quit()
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        GameSettings.MAP_CACHE = True
+        GameSettings.MAP_CACHE_DIR = self.tmpdir.name
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _cache_files(self) -> list[str]:
+        return [os.path.join(self.tmpdir.name, f) for f in os.listdir(self.tmpdir.name)]
+
+    def test_round_trip(self):
+        from src.maps.map import Map
+        baked = Map(MAP_NAME, [], Position(0, 0))
+        self.assertEqual(len(self._cache_files()), 1)
+        cached = Map(MAP_NAME, [], Position(0, 0))
+
+        self.assertIsNone(cached._tmxdata, "map was baked again instead of loaded")
+        self.assertEqual(pg.image.tobytes(baked._surface, "RGB"), pg.image.tobytes(cached._surface, "RGB"))
+        self.assertEqual(baked._collision_map, cached._collision_map)
+
+    def test_rejects_foreign_files(self):
+        from src.maps.map_cache import load_baked, CACHE_VERSION
+        from src.maps.map import Map
+        Map(MAP_NAME, [], Position(0, 0))
+        cache_file = self._cache_files()[0]
+        with open(cache_file, "rb") as f:
+            data = f.read()
+
+        for broken in (
+            b"XXXX" + data[4:],  # wrong magic
+            data[:4] + (CACHE_VERSION + 1).to_bytes(2, "little") + data[6:],  # wrong version
+            data[:-1],  # truncated
+            data + b"\0",  # trailing bytes
+        ):
+            with open(cache_file, "wb") as f:
+                f.write(broken)
+            self.assertIsNone(load_baked(MAP_NAME))
+
+
+if __name__ == "__main__":
+    unittest.main()
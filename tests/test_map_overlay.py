@@ -0,0 +1,96 @@
+"""
+Maps with a Tiled layer flagged "overlay" keep that layer out of the opaque
+base and draw it afterwards from sparse chunks. Nothing is drawn in between
+here, so the composited result must match the map baked without the flag.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+import os
+import re
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from src.utils import GameSettings, Position, PositionCamera
+from src.utils.loader import ASSETS_DIR
+
+MAP_NAME = "gym.tmx"
+# The topmost layer of gym.tmx, so drawing it last keeps the layer order
+OVERLAY_LAYER = "collision_table"
+
+
+class MapOverlayTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pg.init()
+        pg.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+        cls._map_cache = GameSettings.MAP_CACHE
+        cls._draw_hitboxes = GameSettings.DRAW_HITBOXES
+        GameSettings.MAP_CACHE = False
+        # The composites compare map pixels only
+        GameSettings.DRAW_HITBOXES = False
+
+        from src.maps.map import Map
+        cls.Map = Map
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.overlay_tmx = cls._write_overlay_copy(cls.tmpdir.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        GameSettings.MAP_CACHE = cls._map_cache
+        GameSettings.DRAW_HITBOXES = cls._draw_hitboxes
+        cls.tmpdir.cleanup()
+        pg.quit()
+
+    @staticmethod
+    def _write_overlay_copy(directory: str) -> str:
+        """gym.tmx with OVERLAY_LAYER flagged as an overlay, tileset path made absolute."""
+        maps_dir = ASSETS_DIR / "maps"
+        text = (maps_dir / MAP_NAME).read_text(encoding="utf-8")
+        text = re.sub(r'source="([^"]+)"', lambda m: f'source="{(maps_dir / m.group(1)).resolve().as_posix()}"', text)
+        text, count = re.subn(
+            rf'(<layer [^>]*name="{OVERLAY_LAYER}"[^>]*>)',
+            r'\1\n  <properties>\n   <property name="overlay" type="bool" value="true"/>\n  </properties>',
+            text,
+        )
+        assert count == 1, f"{OVERLAY_LAYER} not found in {MAP_NAME}"
+        path = os.path.join(directory, "gym_overlay.tmx")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    @staticmethod
+    def _composite(game_map) -> pg.Surface:
+        target = pg.Surface(game_map.pixel_size, 0, pg.display.get_surface())
+        camera = PositionCamera(0, 0)
+        game_map.draw(target, camera)
+        game_map.draw_overlay(target, camera)
+        return target
+
+    def test_overlay_matches_flattened_map(self):
+        flat = self.Map(MAP_NAME, [], Position(0, 0))
+        layered = self.Map(self.overlay_tmx, [], Position(0, 0))
+
+        self.assertEqual(flat._overlay, [])
+        self.assertTrue(layered._overlay, "overlay layer produced no chunks")
+        # The overlay layer is really left out of the base ...
+        self.assertNotEqual(pg.image.tobytes(flat._surface, "RGB"), pg.image.tobytes(layered._surface, "RGB"))
+        # ... and drawing it on top gives back the same pixels
+        self.assertEqual(pg.image.tobytes(self._composite(flat), "RGB"),
+                         pg.image.tobytes(self._composite(layered), "RGB"))
+
+    def test_overlay_keeps_only_chunks_with_tiles(self):
+        layered = self.Map(self.overlay_tmx, [], Position(0, 0))
+        layer = layered.tmxdata.get_layer_by_name(OVERLAY_LAYER)
+        ts = GameSettings.TILE_SIZE
+        tiles = {(x, y) for x, y, gid in layer if gid}
+        for rect, _ in layered._overlay:
+            self.assertTrue(any(rect.collidepoint(x * ts, y * ts) for x, y in tiles))
+
+
+if __name__ == "__main__":
+    unittest.main()
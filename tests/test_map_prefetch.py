@@ -0,0 +1,84 @@
+"""
+Standing near two teleporters prefetches both destinations. Each must be
+built once, not evicted and rebuilt every frame because the other one
+pushed it out of MAP_MEMORY_BUDGET.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+import json
+import os
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from src.utils import GameSettings, Position
+
+SAVE = "saves/game0.json"
+START_MAP = "map.tmx"
+# Tile on map.tmx within MAP_PREFETCH_DISTANCE of both the gym.tmx and new.tmx teleporters
+NEAR_BOTH = (20, 27)
+FRAMES = 300
+
+
+class MapPrefetchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pg.init()
+        pg.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+        cls._map_cache = GameSettings.MAP_CACHE
+        cls._budget = GameSettings.MAP_MEMORY_BUDGET
+        GameSettings.MAP_CACHE = False
+
+        from src.maps.map import Map, MapInfo
+        cls.Map = Map
+        with open(SAVE, "r") as f:
+            cls.map_infos = {e["path"]: MapInfo.from_dict(e) for e in json.load(f)["map"]}
+
+    @classmethod
+    def tearDownClass(cls):
+        GameSettings.MAP_CACHE = cls._map_cache
+        pg.quit()
+
+    def tearDown(self):
+        GameSettings.MAP_MEMORY_BUDGET = self._budget
+
+    def _game_manager(self):
+        from src.core.managers.game_manager import GameManager
+        ts = GameSettings.TILE_SIZE
+        player = SimpleNamespace(position=Position(NEAR_BOTH[0] * ts, NEAR_BOTH[1] * ts))
+        gm = GameManager(self.map_infos, START_MAP, player, {key: [] for key in self.map_infos})
+        gm.current_map  # Loaded before counting
+        return gm
+
+    def _play(self, gm) -> int:
+        """Run FRAMES frames of prefetching; returns how many maps were built."""
+        with mock.patch.object(self.Map, "from_info", wraps=self.Map.from_info) as built:
+            for _ in range(FRAMES):
+                gm.prefetch_maps()
+                time.sleep(0.001)   # Let the worker decode, like a real frame would
+        gm.prefetcher.cancel()
+        return built.call_count
+
+    def test_default_budget_keeps_both_destinations(self):
+        gm = self._game_manager()
+        self.assertEqual(self._play(gm), 2)
+        self.assertEqual(set(gm.maps), {START_MAP, "gym.tmx", "new.tmx"})
+
+    def test_tight_budget_does_not_thrash(self):
+        gm = self._game_manager()
+        # Room for the current map and one destination, not both
+        small = self.Map.from_info(self.map_infos["gym.tmx"]).memory_usage()
+        GameSettings.MAP_MEMORY_BUDGET = gm.current_map.memory_usage() + small * 3 // 2
+        self.assertLessEqual(self._play(gm), 2)
+        self.assertIn(START_MAP, gm.maps)
+        self.assertLessEqual(sum(m.memory_usage() for m in gm.maps.values()), GameSettings.MAP_MEMORY_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()